@@ -6,22 +6,60 @@ GitHub: https://github.com/Water-Run/biliandout
 """
 
 import contextlib
+import ctypes
+import functools
 import hashlib
+import io
 import json
 import logging
 import os
+import queue
+import re
+import shlex
 import shutil
+import signal
+import socket
+import string
 import subprocess
 import sys
+import tarfile
 import tempfile
-from dataclasses import dataclass
-from enum import Enum, auto
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from enum import Enum, Flag, auto
 from pathlib import Path
-from typing import Any
-
-from PyQt6.QtCore import QSize, Qt, QObject, QThread, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QFont, QIcon, QPalette, QPixmap
+from typing import Any, Callable, Iterator, Literal, Mapping, overload
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QItemSelection,
+    QModelIndex,
+    QObject,
+    QRectF,
+    QSize,
+    QStandardPaths,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QIcon,
+    QImageReader,
+    QPainter,
+    QPalette,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QComboBox,
     QDialog,
@@ -30,15 +68,18 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QProgressBar,
     QScrollArea,
     QSizePolicy,
+    QStackedWidget,
     QStatusBar,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextBrowser,
     QVBoxLayout,
     QWidget,
@@ -46,6 +87,11 @@ from PyQt6.QtWidgets import (
 
 import biliffm4s
 
+try:
+    import orjson  # 可选依赖：更快的 JSON 解析
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # ============================================================
 # 日志配置
 # ============================================================
@@ -65,27 +111,86 @@ BILI_SOURCES: dict[str, dict[str, str]] = {
     "international": {"package": "com.bilibili.app.in", "name": "哔哩哔哩国际版"},
 }
 
+# 所有哔哩哔哩客户端包名，用于在 Android/data 中快速匹配
+BILI_PACKAGES = frozenset(source["package"] for source in BILI_SOURCES.values())
+
+# 各客户端缓存目录相对存储根目录的路径
+BILI_DOWNLOAD_SUBPATHS: dict[str, str] = {
+    key: f"Android/data/{source['package']}/download" for key, source in BILI_SOURCES.items()
+}
+
 VERSION = "1.1"
 
+# 以子进程执行单个合并任务时的命令行参数：<程序> --combine <源目录> <输出文件>
+COMBINE_ARG = "--combine"
+
+# 清晰度ID -> 名称
+QUALITY_MAP: dict[int, str] = {
+    127: "8K",
+    126: "杜比视界",
+    125: "HDR",
+    120: "4K",
+    116: "1080P60",
+    112: "1080P+",
+    80: "1080P",
+    74: "720P60",
+    64: "720P",
+    32: "480P",
+    16: "360P",
+}
+
 COVER_CACHE_DIR = Path(tempfile.gettempdir()) / "biliandout_covers"
 COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# 路径中的 download 目录（不区分大小写，兼容两种分隔符）
+DOWNLOAD_DIR_RE = re.compile(r"[\\/]download[\\/]", re.IGNORECASE)
+
+# index.json 解析结果缓存（不能放在封面缓存目录，每次扫描前会清空该目录）
+INDEX_CACHE_FILE = Path(tempfile.gettempdir()) / "biliandout_index_cache.json"
+
+# adb devices -l 中处于 device 状态的行：序列号与可选的 model 字段
+ADB_DEVICE_RE = re.compile(r"^(\S+)[ \t]+device(?=\s|$)(?:.*?\bmodel:(\S+))?", re.MULTILINE)
+
+# QPixmapCache 上限（KB），封面解码结果按路径缓存
+PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+
 try:
     CREATE_NO_WINDOW = subprocess.CREATE_NO_WINDOW  # type: ignore[attr-defined]
 except AttributeError:
     CREATE_NO_WINDOW = 0
 
+# Windows 下所有子进程共用的隐藏窗口启动信息（subprocess 每次调用时会复制一份）
+if sys.platform == "win32":
+    HIDDEN_STARTUPINFO: subprocess.STARTUPINFO | None = subprocess.STARTUPINFO()  # type: ignore[attr-defined]
+    HIDDEN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore[attr-defined]
+    HIDDEN_STARTUPINFO.wShowWindow = subprocess.SW_HIDE  # type: ignore[attr-defined]
+else:
+    HIDDEN_STARTUPINFO = None
+
 # ============================================================
 # 工具函数
 # ============================================================
+def safe_json_loads(raw: bytes) -> dict[str, Any]:
+    """安全解析JSON字节串，失败或顶层不是对象时返回空字典。"""
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as exc:
+        logger.debug("解析 JSON 失败: %s", exc)
+        return {}
+    if not isinstance(data, dict):
+        logger.debug("JSON 顶层不是对象: %s", type(data).__name__)
+        return {}
+    return data
+
+
 def safe_json_load(path: Path) -> dict[str, Any]:
     """安全加载JSON文件，失败时返回空字典。"""
     try:
-        with path.open("r", encoding="utf-8") as file:
-            return json.load(file)
-    except (OSError, json.JSONDecodeError) as exc:
+        raw = path.read_bytes()
+    except OSError as exc:
         logger.debug("读取 JSON 失败 %s: %s", path, exc)
         return {}
+    return safe_json_loads(raw)
 
 
 def remove_file(path: Path) -> None:
@@ -94,28 +199,144 @@ def remove_file(path: Path) -> None:
         path.unlink()
 
 
+@overload
+def run_command(
+    command: list[str],
+    *,
+    timeout: float | None = None,
+    capture_output: bool = True,
+    text: Literal[True] = True,
+) -> subprocess.CompletedProcess[str]: ...
+
+
+@overload
+def run_command(
+    command: list[str],
+    *,
+    timeout: float | None = None,
+    capture_output: bool = True,
+    text: Literal[False],
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
 def run_command(
     command: list[str],
     *,
     timeout: float | None = None,
     capture_output: bool = True,
     text: bool = True,
-) -> subprocess.CompletedProcess[str]:
-    """执行命令并隐藏控制台窗口。"""
+) -> subprocess.CompletedProcess[str] | subprocess.CompletedProcess[bytes]:
+    """执行命令并隐藏控制台窗口，不捕获输出时直接丢弃；text=False 时输出为字节。"""
+    output = subprocess.PIPE if capture_output else subprocess.DEVNULL
     return subprocess.run(
         command,
         timeout=timeout,
         creationflags=CREATE_NO_WINDOW,
-        capture_output=capture_output,
+        startupinfo=HIDDEN_STARTUPINFO,
+        stdout=output,
+        stderr=output,
         text=text,
     )
 
 
+def start_process(command: list[str]) -> subprocess.Popen[bytes]:
+    """在独立进程组中启动命令（丢弃输出），便于取消时整组终止。"""
+    if sys.platform == "win32":
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP,
+            startupinfo=HIDDEN_STARTUPINFO,
+        )
+    return subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def terminate_process(process: subprocess.Popen[bytes]) -> None:
+    """终止子进程及其派生的进程（POSIX 下终止整个进程组，Windows 下结束进程树），忽略进程已退出等错误。"""
+    if process.poll() is not None:
+        return
+    with contextlib.suppress(OSError):
+        if sys.platform == "win32":
+            # 合并子进程还会启动 ffmpeg，只结束直接子进程会留下仍在写文件的 ffmpeg
+            with contextlib.suppress(subprocess.SubprocessError):
+                run_command(
+                    ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                    timeout=5,
+                    capture_output=False,
+                )
+            if process.poll() is None:
+                process.terminate()
+        else:
+            os.killpg(process.pid, signal.SIGTERM)
+
+
+def combine_command(source: str, output: str) -> list[str]:
+    """返回在子进程中执行一次 biliffm4s 合并的命令（打包后 sys.executable 即程序本身）。"""
+    if getattr(sys, "frozen", False):
+        return [sys.executable, COMBINE_ARG, source, output]
+    return [sys.executable, str(Path(__file__).resolve()), COMBINE_ARG, source, output]
+
+
 def format_bytes_to_mb(size_bytes: int) -> float:
     """将字节转换为MB。"""
     return size_bytes / (1024 * 1024)
 
 
+def get_quality_name(quality_id: int) -> str:
+    """根据质量ID获取质量名称。"""
+    name = QUALITY_MAP.get(quality_id)
+    if name is not None:
+        return name
+    return f"{quality_id}P" if quality_id else ""
+
+
+def load_cover_pixmap(path: Path, size: QSize) -> QPixmap | None:
+    """按路径与目标尺寸从 QPixmapCache 取封面，未命中时缩放解码并缓存，失败返回 None。"""
+    key = f"{path}@{size.width()}x{size.height()}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    reader = QImageReader(str(path))
+    source_size = reader.size()
+    if source_size.isValid():
+        # 解码阶段直接缩放到目标尺寸（JPEG 可跳过大部分 IDCT 计算）
+        reader.setScaledSize(source_size.scaled(size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    if not source_size.isValid():
+        image = image.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def load_scaled_logo(path: str, size: int, device_ratio: float) -> QPixmap | None:
+    """加载并按设备像素比平滑缩放 logo，失败返回 None。"""
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        return None
+    scaled = pixmap.scaled(
+        QSize(size, size) * device_ratio,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+    scaled.setDevicePixelRatio(device_ratio)
+    return scaled
+
+
 # ============================================================
 # 样式定义
 # ============================================================
@@ -134,213 +355,178 @@ COLORS = {
     "border_focus": "#fb7299",
 }
 
-STYLESHEET = f"""
-QMainWindow {{
-    background-color: {COLORS["background"]};
-}}
+# 样式表模板，模块加载时用 COLORS 替换一次
+STYLESHEET_TEMPLATE = string.Template("""
+QMainWindow {
+    background-color: ${background};
+}
 
-QGroupBox {{
+QGroupBox {
     font-weight: bold;
     font-size: 11px;
-    border: 1px solid {COLORS["border"]};
+    border: 1px solid ${border};
     border-radius: 5px;
     margin-top: 8px;
     padding: 6px;
-    background-color: {COLORS["surface"]};
-}}
+    background-color: ${surface};
+}
 
-QGroupBox::title {{
+QGroupBox::title {
     subcontrol-origin: margin;
     left: 8px;
     padding: 0 3px;
-    color: {COLORS["text"]};
-}}
+    color: ${text};
+}
 
-QLabel {{
-    color: {COLORS["text"]};
+QLabel {
+    color: ${text};
     font-size: 11px;
-}}
+}
 
-QLabel#mutedLabel {{
-    color: {COLORS["text_muted"]};
+QLabel#mutedLabel {
+    color: ${text_muted};
     font-size: 10px;
-}}
+}
 
-QLabel#pathLabel {{
-    color: {COLORS["primary"]};
+QLabel#pathLabel {
+    color: ${primary};
     font-size: 10px;
-}}
+}
 
-QLabel#emptyHint {{
-    color: {COLORS["text_secondary"]};
+QLabel#emptyHint {
+    color: ${text_secondary};
     font-size: 11px;
     line-height: 1.5;
-}}
-
-QLabel#videoTitleLabel {{
-    font-size: 11px;
-    font-weight: bold;
-    color: {COLORS["text"]};
-}}
+}
 
-QLabel#videoInfoLabel {{
+QLabel#loadingStatusLabel {
     font-size: 10px;
-    color: {COLORS["text_secondary"]};
-}}
-
-QLabel#videoPathLabel {{
-    font-size: 9px;
-    color: {COLORS["text_muted"]};
-}}
+    color: ${text_secondary};
+}
 
-QLabel#loadingStatusLabel {{
+QLabel#aboutVersionLabel {
     font-size: 10px;
-    color: {COLORS["text_secondary"]};
-}}
+    color: ${text_secondary};
+}
+
+QFrame#aboutSeparator {
+    background-color: ${border};
+}
 
-QPushButton {{
-    background-color: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
+QPushButton {
+    background-color: ${surface};
+    border: 1px solid ${border};
     border-radius: 3px;
     padding: 4px 10px;
     font-size: 11px;
-    color: {COLORS["text"]};
+    color: ${text};
     min-height: 22px;
-}}
+}
 
-QPushButton:hover {{
+QPushButton:hover {
     background-color: #f0f0f0;
     border-color: #cccccc;
-}}
+}
 
-QPushButton:pressed {{
+QPushButton:pressed {
     background-color: #e0e0e0;
-}}
+}
 
-QPushButton:disabled {{
+QPushButton:disabled {
     background-color: #f0f0f0;
     color: #aaaaaa;
     border-color: #e0e0e0;
-}}
+}
 
-QPushButton#primaryBtn {{
-    background-color: {COLORS["primary"]};
+QPushButton#primaryBtn {
+    background-color: ${primary};
     color: white;
     border: none;
     font-weight: bold;
     padding: 5px 14px;
     font-size: 11px;
     min-height: 24px;
-}}
+}
 
-QPushButton#primaryBtn:hover {{
-    background-color: {COLORS["primary_hover"]};
-}}
+QPushButton#primaryBtn:hover {
+    background-color: ${primary_hover};
+}
 
-QPushButton#primaryBtn:pressed {{
-    background-color: {COLORS["primary_pressed"]};
-}}
+QPushButton#primaryBtn:pressed {
+    background-color: ${primary_pressed};
+}
 
-QPushButton#primaryBtn:disabled {{
+QPushButton#primaryBtn:disabled {
     background-color: #cccccc;
-}}
+}
 
-QPushButton#successBtn {{
-    background-color: {COLORS["success"]};
+QPushButton#successBtn {
+    background-color: ${success};
     color: white;
     border: none;
     font-weight: bold;
     min-height: 22px;
-}}
+}
 
-QPushButton#successBtn:hover {{
-    background-color: {COLORS["success_hover"]};
-}}
+QPushButton#successBtn:hover {
+    background-color: ${success_hover};
+}
 
-QPushButton#successBtn:disabled {{
+QPushButton#successBtn:disabled {
     background-color: #cccccc;
-}}
+}
 
-QPushButton#pauseBtn {{
+QPushButton#pauseBtn {
     background-color: #f0ad4e;
     color: white;
     border: none;
     font-weight: bold;
     min-height: 22px;
-}}
+}
 
-QPushButton#pauseBtn:hover {{
+QPushButton#pauseBtn:hover {
     background-color: #ec971f;
-}}
+}
 
-QComboBox {{
-    background-color: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
+QComboBox {
+    background-color: ${surface};
+    border: 1px solid ${border};
     border-radius: 3px;
     padding: 4px 8px;
     font-size: 11px;
-    color: {COLORS["text"]};
+    color: ${text};
     min-height: 22px;
-}}
+}
 
-QComboBox:hover {{
-    border-color: {COLORS["border_focus"]};
-}}
+QComboBox:hover {
+    border-color: ${border_focus};
+}
 
-QComboBox:focus {{
-    border-color: {COLORS["border_focus"]};
-}}
+QComboBox:focus {
+    border-color: ${border_focus};
+}
 
-QComboBox::drop-down {{
+QComboBox::drop-down {
     border: none;
     width: 20px;
-}}
+}
 
-QComboBox QAbstractItemView {{
-    background-color: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
+QComboBox QAbstractItemView {
+    background-color: ${surface};
+    border: 1px solid ${border};
     selection-background-color: #fff0f5;
-    selection-color: {COLORS["text"]};
+    selection-color: ${text};
     outline: none;
     padding: 3px;
-}}
+}
 
-QListWidget {{
-    background-color: {COLORS["background"]};
+QListView#videoList {
+    background-color: ${background};
     border: none;
     outline: none;
-}}
-
-QListWidget::item {{
-    margin: 3px 0;
-    padding: 0;
-    border: none;
-    background-color: transparent;
-}}
-
-QListWidget::item:selected {{
-    background-color: transparent;
-}}
-
-QWidget#videoItem {{
-    background-color: {COLORS["surface"]};
-    border: 1px solid {COLORS["border"]};
-    border-radius: 6px;
-}}
-
-QWidget#videoItemSelected {{
-    background-color: #fff6fa;
-    border: 2px solid {COLORS["primary"]};
-    border-radius: 6px;
-}}
-
-QLabel#coverLabel {{
-    border: 1px solid {COLORS["border"]};
-    border-radius: 4px;
-    background-color: #fdfdfd;
-}}
+}
 
-QProgressBar {{
+QProgressBar {
     border: none;
     border-radius: 3px;
     text-align: center;
@@ -348,44 +534,46 @@ QProgressBar {{
     font-size: 9px;
     min-height: 16px;
     max-height: 16px;
-}}
+}
 
-QProgressBar::chunk {{
-    background-color: {COLORS["success"]};
+QProgressBar::chunk {
+    background-color: ${success};
     border-radius: 3px;
-}}
+}
 
-QProgressBar#scanProgress::chunk {{
-    background-color: {COLORS["primary"]};
-}}
+QProgressBar#scanProgress::chunk {
+    background-color: ${primary};
+}
 
-QStatusBar {{
-    background-color: {COLORS["surface"]};
-    border-top: 1px solid {COLORS["border"]};
+QStatusBar {
+    background-color: ${surface};
+    border-top: 1px solid ${border};
     font-size: 10px;
-    color: {COLORS["text_secondary"]};
+    color: ${text_secondary};
     padding: 2px;
-}}
+}
 
-QTextBrowser {{
+QTextBrowser {
     background-color: transparent;
     border: none;
     font-size: 11px;
-    color: {COLORS["text"]};
-}}
+    color: ${text};
+}
 
-#emptyState {{
+#emptyState {
     background-color: #fafafa;
     border-radius: 6px;
     border: 1px solid #ebebeb;
     padding: 16px;
-}}
+}
 
-QScrollArea {{
+QScrollArea {
     border: none;
     background-color: transparent;
-}}
-"""
+}
+""")
+
+STYLESHEET = STYLESHEET_TEMPLATE.substitute(COLORS)
 
 
 # ============================================================
@@ -408,31 +596,74 @@ class CachedVideo:
     frame_rate: str = ""
     cover_path: Path | None = None
 
+    # 显示字符串在首次访问时生成并缓存（扫描后视频信息不再修改）
+    _display_title: str | None = field(default=None, init=False, repr=False, compare=False)
+    _size_display: str | None = field(default=None, init=False, repr=False, compare=False)
+    _tech_info: str | None = field(default=None, init=False, repr=False, compare=False)
+    _info_display: str | None = field(default=None, init=False, repr=False, compare=False)
+    _path_display: str | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def display_title(self) -> str:
         """返回显示用的标题。"""
-        if self.part_title and self.part_title != self.title:
-            return f"{self.title} - {self.part_title}"
-        return self.title
+        if self._display_title is None:
+            if self.part_title and self.part_title != self.title:
+                self._display_title = f"{self.title} - {self.part_title}"
+            else:
+                self._display_title = self.title
+        return self._display_title
 
     @property
     def size_display(self) -> str:
         """返回格式化的文件大小。"""
-        if self.size_mb >= 1024:
-            return f"{self.size_mb / 1024:.2f} GB"
-        return f"{self.size_mb:.1f} MB"
+        if self._size_display is None:
+            if self.size_mb >= 1024:
+                self._size_display = f"{self.size_mb / 1024:.2f} GB"
+            else:
+                self._size_display = f"{self.size_mb:.1f} MB"
+        return self._size_display
 
     @property
     def tech_info(self) -> str:
         """返回技术信息字符串。"""
-        parts: list[str] = []
-        if self.resolution:
-            parts.append(self.resolution)
-        if self.frame_rate:
-            parts.append(f"{self.frame_rate}fps")
-        if self.quality:
-            parts.append(self.quality)
-        return " · ".join(parts)
+        if self._tech_info is None:
+            parts: list[str] = []
+            if self.resolution:
+                parts.append(self.resolution)
+            if self.frame_rate:
+                parts.append(f"{self.frame_rate}fps")
+            if self.quality:
+                parts.append(self.quality)
+            self._tech_info = " · ".join(parts)
+        return self._tech_info
+
+    @property
+    def info_display(self) -> str:
+        """返回列表中显示的信息行（大小 | 技术信息 | BV号）。"""
+        if self._info_display is None:
+            parts = [self.size_display]
+            if self.tech_info:
+                parts.append(self.tech_info)
+            if self.bvid:
+                parts.append(self.bvid)
+            self._info_display = " | ".join(parts)
+        return self._info_display
+
+    @property
+    def path_display(self) -> str:
+        """返回简化后的路径，只保留 download 之后的部分。"""
+        if self._path_display is None:
+            full_path = str(self.folder_path)
+            match = DOWNLOAD_DIR_RE.search(full_path)
+            if match:
+                self._path_display = "...\\" + full_path[match.end():]
+            else:
+                # 找不到 download 时只保留最后3级目录
+                parts = full_path.replace("/", "\\").split("\\")
+                self._path_display = (
+                    "...\\" + "\\".join(parts[-3:]) if len(parts) > 3 else full_path
+                )
+        return self._path_display
 
 
 class ScanState(Enum):
@@ -442,181 +673,175 @@ class ScanState(Enum):
     PAUSED = auto()
 
 
+class UiUpdate(Flag):
+    """待刷新的界面部分，同一轮事件循环内的多次请求合并执行。"""
+    NONE = 0
+    COUNTS = auto()
+    ACTIONS = auto()
+
+
 # ============================================================
-# 视频列表项组件
+# 视频列表模型与绘制委托
 # ============================================================
-class VideoListItemWidget(QFrame):
-    """视频列表项的自定义Widget。"""
-
-    COVER_SIZE = QSize(80, 60)
+class VideoListModel(QAbstractListModel):
+    """视频列表数据模型，持有扫描到的视频。"""
 
-    def __init__(self, video: CachedVideo, parent: QWidget | None = None) -> None:
+    def __init__(self, parent: QObject | None = None) -> None:
+        """初始化空列表。"""
         super().__init__(parent)
-        self.video = video
-        self._is_selected = False
-        self._cover_pixmap: QPixmap | None = None
-
-        self._setup_ui()
-        self._apply_default_style()
-        self.update_content(video)
-
-    def _apply_default_style(self) -> None:
-        """应用默认样式。"""
-        self.setStyleSheet("""
-            VideoListItemWidget {
-                background-color: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-            }
-        """)
+        self.videos: list[CachedVideo] = []
 
-    def _setup_ui(self) -> None:
-        """设置UI组件。"""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(10)
-
-        # 封面
-        self.cover_label = QLabel()
-        self.cover_label.setFixedSize(self.COVER_SIZE)
-        self.cover_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.cover_label.setStyleSheet(
-            f"border: 1px solid {COLORS['border']}; border-radius: 4px; background-color: #fdfdfd;"
-        )
-        layout.addWidget(self.cover_label, 0, Qt.AlignmentFlag.AlignTop)
-
-        # 文本区域
-        text_container = QWidget()
-        text_layout = QVBoxLayout(text_container)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(3)
-
-        self.title_label = QLabel()
-        self.title_label.setStyleSheet("border: none; font-weight: bold; font-size: 11px;")
-        self.title_label.setWordWrap(True)
-        text_layout.addWidget(self.title_label)
-
-        self.info_label = QLabel()
-        self.info_label.setStyleSheet(f"border: none; font-size: 10px; color: {COLORS['text_secondary']};")
-        self.info_label.setWordWrap(True)
-        text_layout.addWidget(self.info_label)
-
-        self.path_label = QLabel()
-        self.path_label.setStyleSheet(f"border: none; font-size: 9px; color: {COLORS['text_muted']};")
-        self.path_label.setWordWrap(True)
-        text_layout.addWidget(self.path_label)
-
-        text_layout.addStretch()
-        layout.addWidget(text_container, 1)
-
-    def update_content(self, video: CachedVideo) -> None:
-        """更新显示内容。"""
-        self.video = video
-        self.title_label.setText(video.display_title)
-
-        info_parts = [video.size_display]
-        if video.tech_info:
-            info_parts.append(video.tech_info)
-        if video.bvid:
-            info_parts.append(video.bvid)
-        self.info_label.setText(" | ".join(info_parts))
-
-        # 简化路径显示：只保留 download 之后的部分
-        full_path = str(video.folder_path)
-        display_path = self._simplify_path(full_path)
-        self.path_label.setText(display_path)
-        self.path_label.setToolTip(full_path)  # 悬浮显示完整路径
-
-        self._update_cover(video.cover_path)
-
-    def _simplify_path(self, full_path: str) -> str:
-        """简化路径，只保留 download 之后的部分。"""
-        # 查找 download 目录位置（不区分大小写）
-        lower_path = full_path.lower()
-        markers = ["\\download\\", "/download/"]
-
-        for marker in markers:
-            idx = lower_path.find(marker)
-            if idx != -1:
-                # 保留 download 之后的部分
-                return "...\\" + full_path[idx + len(marker):]
-
-        # 如果找不到 download，尝试只保留最后3级目录
-        parts = full_path.replace("/", "\\").split("\\")
-        if len(parts) > 3:
-            return "...\\" + "\\".join(parts[-3:])
-
-        return full_path
-
-    def _update_cover(self, cover_path: Path | None) -> None:
-        """更新封面图片。"""
-        if cover_path and cover_path.exists():
-            pixmap = QPixmap(str(cover_path))
-            if not pixmap.isNull():
-                self._cover_pixmap = pixmap
-                self._render_cover_pixmap()
-                return
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """返回视频数量。"""
+        return 0 if parent.isValid() else len(self.videos)
 
-        # 无封面时显示占位
-        self._cover_pixmap = None
-        self.cover_label.setText("无封面")
-        self.cover_label.setStyleSheet(
-            f"background-color: #f0f0f0; color: {COLORS['text_muted']}; "
-            f"font-size: 9px; border: 1px solid {COLORS['border']}; border-radius: 4px;"
-        )
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """返回指定角色的数据（UserRole 为 CachedVideo 本身）。"""
+        if not index.isValid():
+            return None
+        video = self.videos[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return video
+        if role == Qt.ItemDataRole.DisplayRole:
+            return video.display_title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return str(video.folder_path)
+        return None
 
-    def _render_cover_pixmap(self) -> None:
-        """渲染封面图片（支持高DPI）。"""
-        if not self._cover_pixmap:
+    def append_videos(self, videos: list[CachedVideo]) -> None:
+        """在末尾追加一批视频（整批只发出一次插入通知）。"""
+        if not videos:
             return
+        first = len(self.videos)
+        self.beginInsertRows(QModelIndex(), first, first + len(videos) - 1)
+        self.videos.extend(videos)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """清空全部视频。"""
+        self.beginResetModel()
+        self.videos.clear()
+        self.endResetModel()
 
-        target_size = self.cover_label.size()
-        if target_size.width() <= 0 or target_size.height() <= 0:
-            return
 
-        device_ratio = max(self.devicePixelRatioF(), 1.0)
-        scaled = self._cover_pixmap.scaled(
-            int(target_size.width() * device_ratio),
-            int(target_size.height() * device_ratio),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        scaled.setDevicePixelRatio(device_ratio)
-        self.cover_label.setPixmap(scaled)
-        self.cover_label.setStyleSheet(
-            f"border: 1px solid {COLORS['border']}; border-radius: 4px; background-color: #fdfdfd;"
-        )
+class VideoItemDelegate(QStyledItemDelegate):
+    """直接绘制视频列表项（封面 + 标题/信息/路径），不为每行创建控件。"""
 
-    def resizeEvent(self, event) -> None:
-        """处理大小变化事件。"""
-        super().resizeEvent(event)
-        if self._cover_pixmap:
-            self._render_cover_pixmap()
+    ITEM_HEIGHT = 90
+    CARD_MARGIN = 3
+    CARD_RADIUS = 6
+    PADDING = QSize(8, 6)
+    COVER_SIZE = QSize(80, 60)
+    COVER_RADIUS = 4
+    TEXT_GAP = 10
+    LINE_SPACING = 3
+
+    def __init__(self, parent: QWidget) -> None:
+        """按全局样式表中原列表项的字号准备字体。"""
+        super().__init__(parent)
+        self._title_font = self._pixel_font(parent.font(), 11, bold=True)
+        self._info_font = self._pixel_font(parent.font(), 10)
+        self._path_font = self._pixel_font(parent.font(), 9)
+        self._broken_covers: set[Path] = set()  # 解码失败的封面，不再重复尝试
 
-    def apply_selection(self, selected: bool) -> None:
-        """应用选中状态样式。"""
-        self._is_selected = selected
+    def forget_broken_covers(self) -> None:
+        """清空解码失败的封面记录。"""
+        self._broken_covers.clear()
+
+    @staticmethod
+    def _pixel_font(base: QFont, pixel_size: int, *, bold: bool = False) -> QFont:
+        """返回指定像素字号的字体。"""
+        font = QFont(base)
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        return font
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """所有列表项等高，宽度随视图。"""
+        return QSize(option.rect.width(), self.ITEM_HEIGHT)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """绘制卡片背景、封面与三行文字。"""
+        video = index.data(Qt.ItemDataRole.UserRole)
+        if not isinstance(video, CachedVideo):
+            return
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        card = QRectF(option.rect.adjusted(0, self.CARD_MARGIN, 0, -self.CARD_MARGIN))
         if selected:
-            # FFmpeg 绿色: #5cb85c 或 #007808
-            self.setStyleSheet("""
-                VideoListItemWidget {
-                    background-color: #f0fff0;
-                    border: 2px solid #5cb85c;
-                    border-radius: 6px;
-                }
-            """)
+            self._draw_frame(painter, card, "#f0fff0", COLORS["success"], 2, self.CARD_RADIUS)
         else:
-            self.setStyleSheet("""
-                VideoListItemWidget {
-                    background-color: #ffffff;
-                    border: 1px solid #e0e0e0;
-                    border-radius: 6px;
-                }
-            """)
+            self._draw_frame(painter, card, COLORS["surface"], COLORS["border"], 1, self.CARD_RADIUS)
+
+        cover = QRectF(
+            card.left() + self.PADDING.width(),
+            card.top() + self.PADDING.height(),
+            self.COVER_SIZE.width(),
+            self.COVER_SIZE.height(),
+        )
+        self._draw_cover(painter, cover, video.cover_path, option)
+
+        text_left = cover.right() + self.TEXT_GAP
+        text_width = max(0, int(card.right() - self.PADDING.width() - text_left))
+        top = cover.top()
+        for text, font, color in (
+            (video.display_title, self._title_font, COLORS["text"]),
+            (video.info_display, self._info_font, COLORS["text_secondary"]),
+            (video.path_display, self._path_font, COLORS["text_muted"]),
+        ):
+            metrics = QFontMetrics(font)
+            painter.setFont(font)
+            painter.setPen(QColor(color))
+            painter.drawText(
+                QRectF(text_left, top, text_width, metrics.height()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                metrics.elidedText(text, Qt.TextElideMode.ElideRight, text_width),
+            )
+            top += metrics.height() + self.LINE_SPACING
+        painter.restore()
+
+    @staticmethod
+    def _draw_frame(
+            painter: QPainter, rect: QRectF, fill: str, border: str, width: int, radius: float
+    ) -> None:
+        """绘制带边框的圆角矩形（边框完整落在 rect 内）。"""
+        half = width / 2
+        painter.setPen(QPen(QColor(border), width))
+        painter.setBrush(QColor(fill))
+        painter.drawRoundedRect(rect.adjusted(half, half, -half, -half), radius, radius)
+
+    def _draw_cover(
+            self, painter: QPainter, rect: QRectF, cover_path: Path | None, option: QStyleOptionViewItem
+    ) -> None:
+        """在 rect 内居中绘制封面（按设备像素尺寸解码并缓存），无封面时绘制占位。"""
+        pixmap = None
+        if cover_path and cover_path not in self._broken_covers:
+            device_ratio = max(option.widget.devicePixelRatioF() if option.widget else 1.0, 1.0)
+            target = rect.adjusted(1, 1, -1, -1)
+            pixmap = load_cover_pixmap(
+                cover_path,
+                QSize(int(target.width() * device_ratio), int(target.height() * device_ratio)),
+            )
+            if pixmap is None:
+                self._broken_covers.add(cover_path)
+
+        if pixmap is None:
+            self._draw_frame(painter, rect, "#f0f0f0", COLORS["border"], 1, self.COVER_RADIUS)
+            painter.setFont(self._path_font)
+            painter.setPen(QColor(COLORS["text_muted"]))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "无封面")
+            return
 
-    def sizeHint(self) -> QSize:
-        """返回建议大小。"""
-        return QSize(300, 90)
+        self._draw_frame(painter, rect, "#fdfdfd", COLORS["border"], 1, self.COVER_RADIUS)
+        width = pixmap.width() / device_ratio
+        height = pixmap.height() / device_ratio
+        painter.drawPixmap(
+            QRectF(rect.center().x() - width / 2, rect.center().y() - height / 2, width, height),
+            pixmap,
+            QRectF(pixmap.rect()),
+        )
 
 
 # ============================================================
@@ -625,8 +850,22 @@ class VideoListItemWidget(QFrame):
 class ScanWorker(QObject):
     """扫描缓存视频的工作线程。"""
 
+    BATCH_SIZE = 32
+    BATCH_INTERVAL = 0.25
+    PREFETCH_CHUNK = 32
+    LOCAL_SCAN_WORKERS = 16
+    PROGRESS_INTERVAL = 0.1
+    COVER_SEARCH_DEPTH = 3
+    # index.json 解析结果缓存的条目上限，超出时先淘汰本次扫描未用到的旧条目
+    INDEX_CACHE_LIMIT = 5000
+    # 列出文件及大小的 find 输出方式，依次尝试：-printf 不可用时由 find 批量调用 stat；
+    # 都不可用时退回一次 ls -R（不含大小）
+    LISTING_ACTIONS = ("-printf '%p\\t%s\\n'", "-exec stat -c '%n %s' {} +")
+    # 批量读取小文件时各文件内容之间的分隔行前缀
+    BATCH_READ_MARK = b"==biliandout-batch-read=="
+
     progress = pyqtSignal(int, int)
-    found = pyqtSignal(object)
+    found = pyqtSignal(list)
     finished = pyqtSignal(int)
     error = pyqtSignal(str)
 
@@ -644,22 +883,35 @@ class ScanWorker(QObject):
         self.source_key = source_key
         self._cancelled = False
         self._paused = False
-        self.temp_dir: Path | None = None
+        # 未暂停时置位；暂停中的线程阻塞等待，恢复或取消时立即唤醒
+        self._resumed = threading.Event()
+        self._resumed.set()
         self.cover_cache_dir = cover_cache_dir
+        self._batch: list[CachedVideo] = []
+        self._last_flush = time.monotonic()
+        self._last_progress = 0.0
+        self._remote_listing: dict[str, dict[str, int | None]] | None = None
+        self._prefetched: dict[str, bytes] = {}
+        self._index_cache: dict[str, Any] = {}
+        self._index_cache_used: set[str] = set()
+        self._index_cache_dirty = False
         if self.cover_cache_dir:
             self.cover_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def cancel(self) -> None:
         """取消扫描。"""
         self._cancelled = True
+        self._resumed.set()
 
     def pause(self) -> None:
         """暂停扫描。"""
+        self._resumed.clear()
         self._paused = True
 
     def resume(self) -> None:
         """恢复扫描。"""
         self._paused = False
+        self._resumed.set()
 
     def is_paused(self) -> bool:
         """返回是否暂停。"""
@@ -669,7 +921,7 @@ class ScanWorker(QObject):
         """执行扫描任务。"""
         count = 0
         try:
-            self.temp_dir = Path(tempfile.mkdtemp())
+            self._index_cache = safe_json_load(INDEX_CACHE_FILE)
             if self.device_type == "adb":
                 count = self._scan_adb()
             elif self.device_type == "custom_path":
@@ -680,104 +932,362 @@ class ScanWorker(QObject):
             logger.exception("扫描过程中出错")
             self.error.emit(f"扫描错误: {str(exc)[:50]}")
         finally:
-            if self.temp_dir and self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self._save_index_cache()
+            DeviceScanner.close_shells()
+            self._flush_found()
             self.finished.emit(count)
 
+    def _save_index_cache(self) -> None:
+        """有新条目或超出上限时写回 index.json 解析结果缓存（先写临时文件再替换）。
+
+        本次扫描用到的条目排在最后，超出 INDEX_CACHE_LIMIT 时从最前面（最久未用）开始淘汰。
+        """
+        if not self._index_cache_dirty and len(self._index_cache) <= self.INDEX_CACHE_LIMIT:
+            return
+        used = self._index_cache_used
+        entries = [item for item in self._index_cache.items() if item[0] not in used]
+        entries.extend(item for item in self._index_cache.items() if item[0] in used)
+        pruned = dict(entries[-self.INDEX_CACHE_LIMIT:])
+        temp_file = INDEX_CACHE_FILE.with_suffix(".tmp")
+        try:
+            temp_file.write_text(json.dumps(pruned, ensure_ascii=False), encoding="utf-8")
+            os.replace(temp_file, INDEX_CACHE_FILE)
+        except OSError as exc:
+            logger.debug("写入 index.json 缓存失败: %s", exc)
+            remove_file(temp_file)
+
+    def _cached_index_info(self, key: str | None) -> tuple[str, str] | None:
+        """查询 index.json 解析结果缓存，命中的条目记为本次扫描用到；格式不对的条目直接删除。"""
+        if not key:
+            return None
+        cached = self._index_cache.get(key)
+        if cached is None:
+            return None
+        if not (isinstance(cached, list) and len(cached) == 2 and all(isinstance(v, str) for v in cached)):
+            self._index_cache.pop(key, None)
+            self._index_cache_dirty = True
+            return None
+        self._index_cache_used.add(key)
+        return cached[0], cached[1]
+
+    def _store_index_info(self, key: str | None, info: tuple[str, str]) -> None:
+        """记录 index.json 解析结果。"""
+        if key:
+            self._index_cache[key] = list(info)
+            self._index_cache_used.add(key)
+            self._index_cache_dirty = True
+
+    def _remote_index_key(self, remote_path: str, files: Mapping[str, int | None]) -> str | None:
+        """ADB index.json 的缓存键（设备 + 路径 + 大小），文件大小未知时返回 None。"""
+        size = files.get("index.json")
+        if size is None:
+            return None
+        return f"{self.device_id}:{remote_path}/index.json|{size}"
+
+    def _emit_found(self, video: CachedVideo) -> None:
+        """缓冲发现的视频，攒够一批或超时后统一发送。"""
+        self._batch.append(video)
+        if (
+            len(self._batch) >= self.BATCH_SIZE
+            or time.monotonic() - self._last_flush >= self.BATCH_INTERVAL
+        ):
+            self._flush_found()
+
+    def _flush_found(self) -> None:
+        """发送缓冲中的视频。"""
+        if self._batch:
+            self.found.emit(self._batch)
+            self._batch = []
+        self._last_flush = time.monotonic()
+
+    def _emit_progress(self, current: int, total: int) -> None:
+        """节流发送进度，最后一项总是发送。"""
+        now = time.monotonic()
+        if current < total and now - self._last_progress < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = now
+        self.progress.emit(current, total)
+
     def _wait_if_paused(self) -> None:
         """如果暂停则等待。"""
+        if self._paused:
+            # 暂停前先把已发现的视频交给界面，便于用户选择导出
+            self._flush_found()
+        self._sleep_while_paused()
+
+    def _sleep_while_paused(self) -> None:
+        """暂停期间阻塞当前线程（可在线程池中调用，不涉及结果缓冲）。"""
         while self._paused and not self._cancelled:
-            QThread.msleep(100)
+            self._resumed.wait()
 
     def _scan_custom_path(self) -> int:
         """扫描自定义路径。"""
-        count = 0
         custom_path = Path(self.device_id)
 
         if not custom_path.exists():
             return 0
 
-        folders = [f for f in custom_path.iterdir() if f.is_dir()]
-        total = len(folders)
-
-        for index, folder in enumerate(folders):
-            self._wait_if_paused()
-            if self._cancelled:
-                break
+        return self._scan_local_folders(self._list_subdirs(custom_path))
 
-            self.progress.emit(index + 1, total)
-            for video in self._find_m4s_local(folder, folder.name):
-                self.found.emit(video)
-                count += 1
+    def _scan_local_folders(self, folders: list[Path]) -> int:
+        """在线程池中并发遍历本地顶层目录，重叠文件系统 I/O 等待。
 
+        结果按目录顺序在扫描线程中发送（列表顺序与逐个扫描时一致），缓冲区只由扫描线程访问。
+        """
+        count = 0
+        total = len(folders)
+        with ThreadPoolExecutor(max_workers=self.LOCAL_SCAN_WORKERS) as executor:
+            futures = [executor.submit(self._scan_local_folder, folder) for folder in folders]
+            try:
+                for index, future in enumerate(futures):
+                    self._wait_if_paused()
+                    if self._cancelled:
+                        break
+
+                    videos = future.result()
+                    self._emit_progress(index + 1, total)
+                    for video in videos:
+                        self._emit_found(video)
+                        count += 1
+            finally:
+                for future in futures:
+                    future.cancel()
         return count
 
+    def _scan_local_folder(self, folder: Path) -> list[CachedVideo]:
+        """线程池任务：遍历单个顶层目录。"""
+        self._sleep_while_paused()
+        if self._cancelled:
+            return []
+        # 在工作线程中完成遍历，扫描线程只负责发送结果
+        return list(self._find_m4s_local(folder, folder.name))
+
     def _scan_adb(self) -> int:
         """通过ADB扫描设备。"""
         count = 0
         adb = DeviceScanner.find_adb()
-        source = BILI_SOURCES.get(self.source_key)
-        if not adb or not source:
+        subpath = BILI_DOWNLOAD_SUBPATHS.get(self.source_key)
+        if not adb or not subpath:
             return 0
 
-        remote_base = f"/sdcard/Android/data/{source['package']}/download"
+        remote_base = f"/sdcard/{subpath}"
         try:
-            result = run_command(
-                [adb, "-s", self.device_id, "shell", f"ls -1 {remote_base}"],
-                timeout=30,
-            )
-            if result.returncode != 0:
+            listing = self._list_remote_files(adb, remote_base)
+            if listing is None:
                 return 0
+            self._remote_listing = listing
 
-            folders = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-            total = len(folders)
-            for index, folder_name in enumerate(folders):
+            video_dirs = sorted(
+                path for path, files in listing.items()
+                if "video.m4s" in files and "audio.m4s" in files
+            )
+            total = len(video_dirs)
+            for index, remote_path in enumerate(video_dirs):
                 self._wait_if_paused()
                 if self._cancelled:
                     break
 
-                self.progress.emit(index + 1, total)
-                folder_path = f"{remote_base}/{folder_name}"
-                for video in self._find_m4s_adb(adb, folder_path, folder_name):
-                    self.found.emit(video)
+                if index % self.PREFETCH_CHUNK == 0:
+                    self._prefetch_adb(
+                        adb, remote_base, video_dirs[index:index + self.PREFETCH_CHUNK]
+                    )
+                self._emit_progress(index + 1, total)
+                files = listing[remote_path]
+                root_folder = remote_path[len(remote_base) + 1:].split("/", 1)[0]
+                size_mb = format_bytes_to_mb((files["video.m4s"] or 0) + (files["audio.m4s"] or 0))
+                video = self._parse_video_adb(adb, remote_path, files, root_folder, size_mb)
+                if video:
+                    self._emit_found(video)
                     count += 1
         except Exception as exc:
             logger.exception("ADB 扫描失败")
             self.error.emit(f"ADB扫描错误: {str(exc)[:40]}")
         return count
 
-    def _find_m4s_adb(
-        self, adb: str, remote_path: str, root_folder: str
-    ) -> list[CachedVideo]:
-        """通过ADB查找m4s文件。"""
-        videos: list[CachedVideo] = []
-        if self._cancelled:
-            return videos
+    def _list_remote_files(
+        self, adb: str, remote_base: str
+    ) -> dict[str, dict[str, int | None]] | None:
+        """用一次 find 列出缓存目录下的相关文件，返回 {目录: {文件名: 字节数}}。
+
+        find 不支持 -printf 时改用 -exec stat 批量取大小（仍是一次 adb 调用）；
+        find 不可用时用一次 ls -R 列出整棵目录树，此时大小为 None。
+        个别子目录不可读时 find 也会返回非零，只要输出中有条目就采用，不再回退。
+        """
+        base_command = (
+            f"find {remote_base} -type f "
+            "\\( -name video.m4s -o -name audio.m4s -o -name index.json -o -name cover.jpg \\) "
+        )
+        for action in self.LISTING_ACTIONS:
+            try:
+                result = self._run_shell(adb, base_command + action, timeout=60)
+            except subprocess.SubprocessError as exc:
+                logger.debug("ADB find 失败: %s", exc)
+                return None
+            listing = self._parse_listing(result.stdout)
+            if listing or result.returncode == 0:
+                if result.returncode != 0:
+                    logger.debug("ADB find 退出码 %s，采用已列出的部分结果", result.returncode)
+                return listing
+            logger.debug("ADB find %s 不可用: %s", action, result.stderr.strip())
+
+        try:
+            result = self._run_shell(adb, f"ls -R {remote_base}", timeout=60)
+        except subprocess.SubprocessError as exc:
+            logger.debug("ADB ls -R 失败: %s", exc)
+            return None
+        # 个别子目录无权限时 ls 返回非零，但其余部分的输出仍然可用
+        if not result.stdout.strip():
+            logger.debug("ADB ls -R 无输出: %s", result.stderr.strip())
+            return None
+        return self._parse_recursive_ls(result.stdout)
+
+    @staticmethod
+    def _parse_listing(output: str) -> dict[str, dict[str, int | None]]:
+        """解析每行“路径 大小”（制表符或空格分隔）的文件列表。"""
+        listing: dict[str, dict[str, int | None]] = {}
+        for line in output.splitlines():
+            parts = line.rsplit(None, 1)
+            if len(parts) != 2 or not parts[1].isdigit():
+                continue
+            directory, _, name = parts[0].rpartition("/")
+            listing.setdefault(directory, {})[name] = int(parts[1])
+        return listing
+
+    @staticmethod
+    def _parse_recursive_ls(output: str) -> dict[str, dict[str, int | None]]:
+        """解析 ls -R 输出：“/目录:”行之后是该目录下的条目名，大小记为 None。"""
+        listing: dict[str, dict[str, int | None]] = {}
+        files: dict[str, int | None] | None = None
+        for line in output.splitlines():
+            if line.startswith("/") and line.endswith(":"):
+                files = listing.setdefault(line[:-1].rstrip("/"), {})
+            elif line and files is not None:
+                files[line] = None
+        return listing
+
+    def _prefetch_adb(self, adb: str, remote_base: str, video_dirs: list[str]) -> None:
+        """用一次 adb exec-out tar 批量拉取这批视频的 index.json 与 cover.jpg，内容保留在内存中。
+
+        设备没有 tar 时改用一次 exec-out cat 批量读取；仍未取到的文件在解析时单独读取。
+        """
+        if self._remote_listing is None:
+            return
+        listing = self._remote_listing
+        self._fill_remote_sizes(adb, video_dirs)
+        wanted: set[str] = set()
+        for remote_path in video_dirs:
+            files = listing[remote_path]
+            if (
+                "index.json" in files
+                and self._cached_index_info(self._remote_index_key(remote_path, files)) is None
+            ):
+                wanted.add(f"{remote_path}/index.json")
+            parent_path = remote_path
+            for _ in range(3):
+                parent_path = parent_path.rsplit("/", 1)[0]
+                if "cover.jpg" in listing.get(parent_path, {}):
+                    wanted.add(f"{parent_path}/cover.jpg")
+                    break
+        wanted.difference_update(self._prefetched)
+        if not wanted:
+            return
+
+        contents = self._fetch_tar(adb, remote_base, wanted)
+        if contents is None:
+            contents = self._adb_batch_read(adb, sorted(wanted))
+        self._prefetched.update(contents)
+
+    def _fetch_tar(self, adb: str, remote_base: str, wanted: set[str]) -> dict[str, bytes] | None:
+        """用一次 adb exec-out tar 读取多个文件，返回 {远程路径: 内容}；设备不支持 tar 时返回 None。"""
+        prefix = f"{remote_base}/"
+        relative = sorted(path[len(prefix):] for path in wanted if path.startswith(prefix))
+        # exec-out 会把参数拼成一条命令行交给设备 shell，路径需要转义
+        quoted = [shlex.quote(path) for path in relative]
         try:
             result = run_command(
-                [adb, "-s", self.device_id, "shell", f"ls -1 {remote_path}"],
-                timeout=10,
+                [
+                    adb, "-s", self.device_id, "exec-out",
+                    "tar", "-cf", "-", "-C", shlex.quote(remote_base), *quoted,
+                ],
+                timeout=60,
+                text=False,
             )
-            if result.returncode != 0:
-                return videos
+        except subprocess.SubprocessError as exc:
+            logger.debug("批量拉取失败: %s", exc)
+            return None
 
-            files = [line.strip() for line in result.stdout.splitlines() if line.strip()]
-            if {"video.m4s", "audio.m4s"}.issubset(files):
-                video = self._parse_video_adb(adb, remote_path, files, root_folder)
-                if video:
-                    videos.append(video)
-            else:
-                for item in files:
-                    if item in {".", ".."}:
+        contents: dict[str, bytes] = {}
+        try:
+            with tarfile.open(fileobj=io.BytesIO(result.stdout), mode="r:") as archive:
+                for member in archive:
+                    remote = prefix + member.name.removeprefix("./")
+                    if not member.isfile() or remote not in wanted:
                         continue
-                    sub_path = f"{remote_path}/{item}"
-                    videos.extend(self._find_m4s_adb(adb, sub_path, root_folder))
+                    source = archive.extractfile(member)
+                    if source is not None:
+                        contents[remote] = source.read()
+        except tarfile.TarError as exc:
+            logger.debug("解析批量拉取结果失败: %s", exc)
+            return None
+        return contents
+
+    def _adb_batch_read(self, adb: str, paths: list[str]) -> dict[str, bytes]:
+        """用一次 adb exec-out 依次 cat 多个小文件，按分隔行拆分输出，返回 {远程路径: 内容}。
+
+        不存在或读取失败的文件内容为空，不会出现在结果中。
+        """
+        if not paths:
+            return {}
+        mark = self.BATCH_READ_MARK.decode()
+        script = "; ".join(
+            f"echo; echo {mark}{index}; cat {shlex.quote(path)} 2>/dev/null"
+            for index, path in enumerate(paths)
+        )
+        try:
+            result = run_command(
+                [adb, "-s", self.device_id, "exec-out", script], timeout=10, text=False
+            )
         except subprocess.SubprocessError as exc:
-            logger.debug("遍历 ADB 目录失败 %s: %s", remote_path, exc)
-        return videos
+            logger.debug("批量读取失败: %s", exc)
+            return {}
+
+        contents: dict[str, bytes] = {}
+        # 每段为“序号\n内容”，序号对应 paths 中的位置
+        for block in result.stdout.split(b"\n" + self.BATCH_READ_MARK)[1:]:
+            number, _, data = block.partition(b"\n")
+            if number.isdigit() and int(number) < len(paths) and data:
+                contents[paths[int(number)]] = data
+        return contents
+
+    def _fill_remote_sizes(self, adb: str, video_dirs: list[str]) -> None:
+        """文件列表缺少大小（ls -R 回退）时，用一次 stat 补齐这批视频的 m4s 与 index.json 大小。"""
+        listing = self._remote_listing
+        if listing is None:
+            return
+        missing = [
+            f"{remote_path}/{name}"
+            for remote_path in video_dirs
+            for name, size in listing[remote_path].items()
+            if size is None and name in {"video.m4s", "audio.m4s", "index.json"}
+        ]
+        if not missing:
+            return
+        command = "stat -c '%n %s' " + " ".join(shlex.quote(path) for path in missing)
+        try:
+            result = self._run_shell(adb, command, timeout=10)
+        except subprocess.SubprocessError as exc:
+            logger.debug("读取远程文件大小失败: %s", exc)
+            return
+        for directory, files in self._parse_listing(result.stdout).items():
+            listing.setdefault(directory, {}).update(files)
 
     def _parse_video_adb(
-            self, adb: str, remote_path: str, files: list[str], root_folder: str
+            self,
+            adb: str,
+            remote_path: str,
+            files: Mapping[str, int | None],
+            root_folder: str,
+            size_mb: float,
     ) -> CachedVideo | None:
         """解析ADB设备上的视频信息。"""
         title = root_folder
@@ -790,32 +1300,39 @@ class ScanWorker(QObject):
 
         # 1. 解析 index.json（与 m4s 同目录）
         if "index.json" in files:
-            local_index = self._pull_temp_file(adb, f"{remote_path}/index.json")
-            if local_index:
-                data = safe_json_load(local_index)
-                resolution, frame_rate = self._parse_index_json(data)
-                remove_file(local_index)
+            cache_key = self._remote_index_key(remote_path, files)
+            info = self._cached_index_info(cache_key)
+            if info is None:
+                remote_index = f"{remote_path}/index.json"
+                data = self._prefetched.pop(remote_index, None)
+                if data is None:
+                    data = self._adb_batch_read(adb, [remote_index]).get(remote_index)
+                if data is not None:
+                    info = self._parse_index_json(safe_json_loads(data))
+                    self._store_index_info(cache_key, info)
+            if info is not None:
+                resolution, frame_rate = info
 
         # 2. 从目录名获取画质（用字符串操作）
         try:
             path_name = remote_path.rsplit("/", 1)[-1]
             quality_id = int(path_name)
-            quality = self._get_quality_name(quality_id)
+            quality = get_quality_name(quality_id)
         except ValueError:
             pass
 
-        # 3. 向上查找 cover.jpg（从父目录开始）
+        # 3. 向上查找 cover.jpg（从父目录开始），已有文件列表时跳过不存在封面的目录
+        listing = self._remote_listing
         parent_path = remote_path.rsplit("/", 1)[0] if "/" in remote_path else remote_path
         for _ in range(3):
-            cover_path = self._pull_cover_adb(adb, parent_path, root_folder)
-            if cover_path:
-                break
+            if listing is None or "cover.jpg" in listing.get(parent_path, {}):
+                cover_path = self._pull_cover_adb(adb, parent_path, root_folder)
+                if cover_path:
+                    break
             if "/" not in parent_path:
                 break
             parent_path = parent_path.rsplit("/", 1)[0]
 
-        size_mb = self._calc_remote_size(adb, remote_path)
-
         # combine_path 是 remote_path 的父目录（c_xxxxx 目录）
         combine_path_str = remote_path.rsplit("/", 1)[0] if "/" in remote_path else remote_path
 
@@ -835,43 +1352,17 @@ class ScanWorker(QObject):
             cover_path=cover_path,
         )
 
-    def _pull_temp_file(self, adb: str, remote_path: str) -> Path | None:
-        """从设备拉取临时文件。"""
-        if not self.temp_dir:
-            return None
-        local_path = self.temp_dir / Path(remote_path).name
-        result = run_command(
-            [adb, "-s", self.device_id, "pull", remote_path, str(local_path)],
-            timeout=10,
-        )
-        if result.returncode == 0 and local_path.exists():
-            return local_path
-        remove_file(local_path)
-        return None
+    def _run_shell(self, adb: str, command: str, *, timeout: float) -> subprocess.CompletedProcess[str]:
+        """在常驻 shell 会话中执行命令，会话无法启动或命令未发出时退回单独的 adb shell 进程。
 
-    def _calc_remote_size(self, adb: str, remote_path: str) -> float:
-        """计算远程文件大小。"""
-        try:
-            result = run_command(
-                [
-                    adb,
-                    "-s",
-                    self.device_id,
-                    "shell",
-                    f"stat -c %s {remote_path}/video.m4s {remote_path}/audio.m4s",
-                ],
-                timeout=10,
-            )
-            if result.returncode == 0:
-                sizes = [
-                    int(line.strip())
-                    for line in result.stdout.splitlines()
-                    if line.strip().isdigit()
-                ]
-                return format_bytes_to_mb(sum(sizes))
-        except subprocess.SubprocessError as exc:
-            logger.debug("读取远程文件大小失败: %s", exc)
-        return 0.0
+        命令发出后超时会抛出 subprocess.TimeoutExpired，不再重复执行。
+        """
+        shell = DeviceScanner.get_shell(adb, self.device_id)
+        if shell:
+            result = shell.run(command, timeout=timeout)
+            if result is not None:
+                return result
+        return run_command([adb, "-s", self.device_id, "shell", command], timeout=timeout)
 
     def _pull_cover_adb(
         self, adb: str, remote_path: str, identifier: str
@@ -881,17 +1372,28 @@ class ScanWorker(QObject):
             return None
 
         cover_remote = f"{remote_path}/cover.jpg"
-        safe_id = hashlib.md5(f"{remote_path}_{identifier}".encode("utf-8")).hexdigest()
+        safe_id = hashlib.blake2b(
+            f"{remote_path}_{identifier}".encode("utf-8"), digest_size=16
+        ).hexdigest()
         cover_local = self.cover_cache_dir / f"{safe_id}.jpg"
 
         # 如果已缓存，直接返回
         if cover_local.exists():
             return cover_local
 
+        prefetched = self._prefetched.pop(cover_remote, None)
+        if prefetched:
+            try:
+                cover_local.write_bytes(prefetched)
+                return cover_local
+            except OSError as exc:
+                logger.debug("保存封面失败: %s", exc)
+
         try:
             result = run_command(
                 [adb, "-s", self.device_id, "pull", cover_remote, str(cover_local)],
                 timeout=15,
+                capture_output=False,
             )
             if result.returncode == 0 and cover_local.exists() and cover_local.stat().st_size > 0:
                 return cover_local
@@ -903,50 +1405,61 @@ class ScanWorker(QObject):
 
     def _scan_drive(self) -> int:
         """扫描本地驱动器。"""
-        count = 0
-        source = BILI_SOURCES.get(self.source_key)
-        if not source:
+        subpath = BILI_DOWNLOAD_SUBPATHS.get(self.source_key)
+        if not subpath:
             return 0
 
-        download_path = Path(self.device_id) / "Android" / "data" / source["package"] / "download"
+        download_path = Path(self.device_id, subpath)
         if not download_path.exists():
             return 0
 
-        folders = [folder for folder in download_path.iterdir() if folder.is_dir()]
-        total = len(folders)
-        for index, folder in enumerate(folders):
-            self._wait_if_paused()
-            if self._cancelled:
-                break
+        return self._scan_local_folders(self._list_subdirs(download_path))
 
-            self.progress.emit(index + 1, total)
-            for video in self._find_m4s_local(folder, folder.name):
-                self.found.emit(video)
-                count += 1
-        return count
+    @staticmethod
+    def _list_subdirs(path: Path) -> list[Path]:
+        """用一次 scandir 列出子目录，类型信息来自目录项，无需逐个 stat。"""
+        try:
+            with os.scandir(path) as iterator:
+                return [Path(entry.path) for entry in iterator if entry.is_dir()]
+        except OSError as exc:
+            logger.debug("列出目录失败 %s: %s", path, exc)
+            return []
 
-    def _find_m4s_local(self, folder: Path, root_folder: str) -> list[CachedVideo]:
-        """在本地目录查找m4s文件。"""
-        videos: list[CachedVideo] = []
-        if self._cancelled:
-            return videos
+    def _find_m4s_local(self, folder: Path, root_folder: str) -> Iterator[CachedVideo]:
+        """在本地目录查找m4s文件（显式栈深度优先遍历，保持原有顺序），边遍历边产出结果。
 
-        video_m4s = folder / "video.m4s"
-        audio_m4s = folder / "audio.m4s"
+        栈中同时携带最近几级祖先目录的 scandir 结果，查找封面时直接复用。
+        """
+        stack: list[tuple[Path, tuple[dict[str, os.DirEntry[str]], ...]]] = [(folder, ())]
+        while stack and not self._cancelled:
+            current, ancestors = stack.pop()
+            # 一次 scandir 取得全部子项，DirEntry 自带类型信息，无需逐个 stat
+            try:
+                with os.scandir(current) as iterator:
+                    entries = {entry.name: entry for entry in iterator}
+            except OSError:
+                continue
 
-        if video_m4s.exists() and audio_m4s.exists():
-            video = self._parse_video_local(folder, root_folder)
-            if video:
-                videos.append(video)
-        else:
-            with contextlib.suppress(PermissionError):
-                for sub in folder.iterdir():
-                    if sub.is_dir():
-                        videos.extend(self._find_m4s_local(sub, root_folder))
-        return videos
-
-    def _parse_video_local(self, folder: Path, root_folder: str) -> CachedVideo | None:
-        """解析本地视频信息。"""
+            if "video.m4s" in entries and "audio.m4s" in entries:
+                video = self._parse_video_local(current, root_folder, entries, ancestors)
+                if video:
+                    yield video
+            else:
+                lineage = ((entries,) + ancestors)[:self.COVER_SEARCH_DEPTH]
+                subdirs = [
+                    (Path(entry.path), lineage) for entry in entries.values()
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+                stack.extend(reversed(subdirs))
+
+    def _parse_video_local(
+            self,
+            folder: Path,
+            root_folder: str,
+            entries: dict[str, os.DirEntry[str]],
+            ancestors: tuple[dict[str, os.DirEntry[str]], ...] = (),
+    ) -> CachedVideo | None:
+        """解析本地视频信息。entries 为 folder 的 scandir 结果，ancestors 为父目录起各级的 scandir 结果。"""
         title = root_folder
         part_title = ""
         bvid = ""
@@ -956,16 +1469,19 @@ class ScanWorker(QObject):
         cover_path: Path | None = None
 
         # 1. 解析 index.json（与 m4s 同目录）
-        index_json = folder / "index.json"
-        if index_json.exists():
-            data = safe_json_load(index_json)
-            resolution, frame_rate = self._parse_index_json(data)
+        index_entry = entries.get("index.json")
+        if index_entry is not None:
+            resolution, frame_rate = self._local_index_info(index_entry)
 
-        # 2. 独立向上查找 cover.jpg（不依赖 entry.json）
+        # 2. 独立向上查找 cover.jpg（不依赖 entry.json），遍历时已读过的目录不再 stat
         current = folder.parent  # 从上一级开始找（即 c_xxxxx 目录）
-        for _ in range(3):
+        for level in range(self.COVER_SEARCH_DEPTH):
             cover_file = current / "cover.jpg"
-            if cover_file.exists():
+            if level < len(ancestors):
+                found = "cover.jpg" in ancestors[level]
+            else:
+                found = cover_file.exists()
+            if found:
                 cover_path = cover_file
                 break
             parent = current.parent
@@ -976,14 +1492,14 @@ class ScanWorker(QObject):
         # 3. 尝试从目录名推断信息
         try:
             quality_id = int(folder.name)
-            quality = self._get_quality_name(quality_id)
+            quality = get_quality_name(quality_id)
         except ValueError:
             pass
 
         video_m4s = folder / "video.m4s"
         audio_m4s = folder / "audio.m4s"
         size_mb = format_bytes_to_mb(
-            video_m4s.stat().st_size + audio_m4s.stat().st_size
+            entries["video.m4s"].stat().st_size + entries["audio.m4s"].stat().st_size
         )
 
         # combine_path 是 folder 的父目录（c_xxxxx 目录）
@@ -1004,74 +1520,171 @@ class ScanWorker(QObject):
             cover_path=cover_path,
         )
 
+    def _local_index_info(self, entry: os.DirEntry[str]) -> tuple[str, str]:
+        """读取本地 index.json 的分辨率和帧率，按 (路径, 大小, 修改时间) 缓存。"""
+        try:
+            stat = entry.stat()
+            cache_key: str | None = f"{entry.path}|{stat.st_size}|{stat.st_mtime_ns}"
+        except OSError:
+            cache_key = None
+        info = self._cached_index_info(cache_key)
+        if info is None:
+            info = self._parse_index_json(safe_json_load(Path(entry.path)))
+            self._store_index_info(cache_key, info)
+        return info
+
     def _parse_index_json(self, data: dict[str, Any]) -> tuple[str, str]:
         """解析index.json获取分辨率和帧率。"""
-        resolution = ""
-        frame_rate = ""
         try:
-            video_list = data.get("video", [])
-            if video_list:
-                video_info = video_list[0]
-                width = video_info.get("width", 0)
-                height = video_info.get("height", 0)
-                if width and height:
-                    resolution = f"{width}×{height}"
-                fps = video_info.get("frame_rate")
-                if fps:
-                    try:
-                        fps_float = float(fps)
-                        frame_rate = (
-                            f"{fps_float:.0f}"
-                            if fps_float == int(fps_float)
-                            else f"{fps_float:.1f}"
-                        )
-                    except (ValueError, TypeError):
-                        pass
-        except (IndexError, TypeError) as exc:
-            logger.debug("解析 index.json 失败: %s", exc)
+            video_info = data["video"][0]
+            width = video_info.get("width")
+            height = video_info.get("height")
+            fps = video_info.get("frame_rate")
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:
+            logger.debug("解析 index.json 失败: %r", exc)
+            return "", ""
+
+        resolution = f"{width}×{height}" if width and height else ""
+        frame_rate = ""
+        if fps:
+            try:
+                fps_float = float(fps)
+            except (ValueError, TypeError):
+                pass
+            else:
+                frame_rate = f"{fps_float:.0f}" if fps_float.is_integer() else f"{fps_float:.1f}"
         return resolution, frame_rate
 
-    @staticmethod
-    def _get_quality_name(quality_id: int) -> str:
-        """根据质量ID获取质量名称。"""
-        quality_map = {
-            127: "8K",
-            126: "杜比视界",
-            125: "HDR",
-            120: "4K",
-            116: "1080P60",
-            112: "1080P+",
-            80: "1080P",
-            74: "720P60",
-            64: "720P",
-            32: "480P",
-            16: "360P",
-        }
-        if quality_id in quality_map:
-            return quality_map[quality_id]
-        return f"{quality_id}P" if quality_id else ""
-
 
 # ============================================================
 # 设备扫描器
 # ============================================================
+class AdbShell:
+    """常驻的 adb shell 会话，元数据命令无需每次启动 adb 进程。
+
+    每条命令后追加一行结束标记及退出码，读取到标记即为该命令输出结束。
+    文件传输（pull / exec-out）仍使用独立进程。
+    """
+
+    SENTINEL = "__BILIANDOUT_DONE__"
+
+    def __init__(self, adb: str, device_id: str) -> None:
+        """启动 shell 进程及输出读取线程。"""
+        self._process = subprocess.Popen(
+            [adb, "-s", device_id, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            creationflags=CREATE_NO_WINDOW,
+            startupinfo=HIDDEN_STARTUPINFO,
+        )
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._read_output, daemon=True).start()
+
+    def _read_output(self) -> None:
+        """读取线程：逐行放入队列，进程结束时放入 None。"""
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            self._lines.put(line.rstrip("\r\n"))
+        self._lines.put(None)
+
+    def is_alive(self) -> bool:
+        """返回 shell 进程是否仍在运行。"""
+        return self._process.poll() is None
+
+    def run(self, command: str, *, timeout: float) -> subprocess.CompletedProcess[str] | None:
+        """执行一条命令。
+
+        会话已断开或命令未能写入时返回 None（命令未执行，可改用单独进程）；
+        命令发出后超时则关闭会话并抛出 subprocess.TimeoutExpired，
+        会话中途断开则返回退出码为 -1 的结果，两者都不应重试（命令可能已部分执行）。
+        """
+        with self._lock:
+            if not self.is_alive():
+                return None
+            try:
+                assert self._process.stdin is not None
+                self._process.stdin.write(f"{command}\necho {self.SENTINEL}$?\n")
+                self._process.stdin.flush()
+            except OSError as exc:
+                logger.debug("写入 adb shell 失败: %s", exc)
+                self.close()
+                return None
+
+            output: list[str] = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    logger.debug("adb shell 无响应: %s", command)
+                    # 命令仍在运行，直接结束会话，不等待其退出
+                    self._process.kill()
+                    self.close()
+                    raise subprocess.TimeoutExpired(command, timeout) from None
+                if line is None:
+                    logger.debug("adb shell 会话中断: %s", command)
+                    self.close()
+                    stdout = "".join(f"{item}\n" for item in output)
+                    return subprocess.CompletedProcess(command, -1, stdout, "")
+                # 命令输出末尾没有换行时，标记会接在同一行
+                marker = line.find(self.SENTINEL)
+                if marker == -1:
+                    output.append(line)
+                    continue
+                if marker:
+                    output.append(line[:marker])
+                code = line[marker + len(self.SENTINEL):]
+                returncode = int(code) if code.isdigit() else 1
+                stdout = "".join(f"{item}\n" for item in output)
+                return subprocess.CompletedProcess(command, returncode, stdout, "")
+
+    def close(self) -> None:
+        """结束 shell 会话。"""
+        with contextlib.suppress(OSError):
+            if self._process.stdin:
+                self._process.stdin.close()
+        try:
+            self._process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+
 class DeviceScanner:
     """设备扫描和操作工具类。"""
 
+    ADB_PATH_FILE = "adb_path.txt"
+    DEVICE_CACHE_TTL = 2.0
+    # GetDriveTypeW: DRIVE_REMOVABLE = 2, DRIVE_FIXED = 3
+    LOCAL_DRIVE_TYPES = frozenset({2, 3})
+    DRIVE_PROBE_WORKERS = 8
+
     _adb_path: str | None = None
+    _shells: dict[str, AdbShell] = {}
+    _device_cache: dict[str, tuple[float, list[tuple[str, str]]]] = {}
+    _adb_tracked = False
 
     @classmethod
     def find_adb(cls) -> str | None:
-        """查找ADB可执行文件路径。"""
+        """查找ADB可执行文件路径（优先使用上次保存的路径，避免启动子进程探测）。"""
         if cls._adb_path:
             return cls._adb_path
 
+        saved = cls._load_saved_adb()
+        if saved:
+            cls._adb_path = saved
+            return saved
+
         adb_name = "adb.exe" if sys.platform == "win32" else "adb"
         try:
             result = run_command([adb_name, "version"], timeout=5)
             if result.returncode == 0:
-                cls._adb_path = adb_name
-                return cls._adb_path
+                return cls._remember_adb(shutil.which(adb_name) or adb_name)
         except OSError:
             pass
 
@@ -1085,13 +1698,127 @@ class DeviceScanner:
 
         for path in possible_paths:
             if path.exists():
-                cls._adb_path = str(path)
-                return cls._adb_path
+                return cls._remember_adb(str(path))
+        return None
+
+    @classmethod
+    def get_shell(cls, adb: str, device_id: str) -> AdbShell | None:
+        """返回设备的常驻 shell 会话（按需创建），无法启动时返回 None。"""
+        shell = cls._shells.get(device_id)
+        if shell and shell.is_alive():
+            return shell
+        try:
+            shell = AdbShell(adb, device_id)
+        except OSError as exc:
+            logger.debug("启动 adb shell 失败: %s", exc)
+            return None
+        cls._shells[device_id] = shell
+        return shell
+
+    @classmethod
+    def close_shells(cls) -> None:
+        """关闭所有常驻 shell 会话。"""
+        for shell in cls._shells.values():
+            shell.close()
+        cls._shells.clear()
+
+    @classmethod
+    def forget_adb(cls) -> None:
+        """清除缓存及保存的ADB路径（路径失效时调用）。"""
+        cls._adb_path = None
+        config_file = cls._adb_config_file()
+        if config_file:
+            remove_file(config_file)
+
+    @classmethod
+    def _remember_adb(cls, path: str) -> str:
+        """缓存ADB路径，绝对路径同时写入配置文件供下次启动使用。"""
+        cls._adb_path = path
+        config_file = cls._adb_config_file()
+        if config_file and os.path.isabs(path):
+            try:
+                config_file.parent.mkdir(parents=True, exist_ok=True)
+                config_file.write_text(path, encoding="utf-8")
+            except OSError as exc:
+                logger.debug("保存 ADB 路径失败: %s", exc)
+        return path
+
+    @classmethod
+    def _load_saved_adb(cls) -> str | None:
+        """读取上次保存的ADB路径，文件不存在或已不可执行时返回 None。"""
+        config_file = cls._adb_config_file()
+        if not config_file:
+            return None
+        try:
+            path = config_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if path and os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
         return None
 
+    @classmethod
+    def _adb_config_file(cls) -> Path | None:
+        """返回保存ADB路径的配置文件位置。"""
+        location = QStandardPaths.writableLocation(
+            QStandardPaths.StandardLocation.AppConfigLocation
+        )
+        return Path(location) / cls.ADB_PATH_FILE if location else None
+
+    @classmethod
+    def refresh(cls, kind: str | None = None) -> None:
+        """使设备列表缓存失效（kind 为 "adb"/"drive" 时只清除该类），下次查询时重新枚举。"""
+        if kind is None:
+            cls._device_cache.clear()
+        else:
+            cls._device_cache.pop(kind, None)
+
+    @classmethod
+    def set_adb_tracked(cls, tracked: bool) -> None:
+        """标记 ADB 设备变化是否由 AdbDeviceTracker 实时通知。"""
+        cls._adb_tracked = tracked
+
+    @classmethod
+    def _cached_devices(
+            cls, kind: str, loader: Callable[[], list[tuple[str, str]]]
+    ) -> list[tuple[str, str]]:
+        """在 DEVICE_CACHE_TTL 秒内复用上次的枚举结果。"""
+        cached = cls._fresh_cache_entry(kind)
+        if cached is not None:
+            return list(cached)
+        devices = loader()
+        cls._device_cache[kind] = (time.monotonic(), devices)
+        return list(devices)
+
+    @classmethod
+    def _fresh_cache_entry(cls, kind: str) -> list[tuple[str, str]] | None:
+        """返回仍可用的缓存设备列表，没有或已过期时返回 None。
+
+        缓存可能被其他线程（设备跟踪、导出拉取失败）同时清除，只读取一次字典再判断。
+        ADB 设备变化被实时跟踪时，缓存一直有效，直到收到变化通知被清除。
+        """
+        cached = cls._device_cache.get(kind)
+        if not cached:
+            return None
+        if kind == "adb" and cls._adb_tracked:
+            return cached[1]
+        if time.monotonic() - cached[0] < cls.DEVICE_CACHE_TTL:
+            return cached[1]
+        return None
+
+    @classmethod
+    def _is_cache_fresh(cls, kind: str) -> bool:
+        """返回该类设备的缓存是否仍可用。"""
+        return cls._fresh_cache_entry(kind) is not None
+
     @classmethod
     def get_adb_devices(cls) -> list[tuple[str, str]]:
-        """获取通过ADB连接的设备列表。"""
+        """获取通过ADB连接的设备列表（短时缓存）。"""
+        return cls._cached_devices("adb", cls._list_adb_devices)
+
+    @classmethod
+    def _list_adb_devices(cls) -> list[tuple[str, str]]:
+        """执行 adb devices 枚举设备。"""
         devices: list[tuple[str, str]] = []
         adb = cls.find_adb()
         if not adb:
@@ -1100,92 +1827,306 @@ class DeviceScanner:
         try:
             result = run_command([adb, "devices", "-l"], timeout=10)
             if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")[1:]
-                for line in lines:
-                    if not line.strip():
-                        continue
-                    parts = line.split()
-                    if len(parts) >= 2 and parts[1] == "device":
-                        serial = parts[0]
-                        model = "Android设备"
-                        for part in parts[2:]:
-                            if part.startswith("model:"):
-                                model = part.split(":")[1].replace("_", " ")
-                                break
-                        devices.append((serial, f"{model} ({serial})"))
+                devices.extend(cls._parse_adb_devices(result.stdout))
         except subprocess.SubprocessError as exc:
             logger.debug("获取 ADB 设备失败: %s", exc)
+        except OSError as exc:
+            # 保存的 adb 已被移动或删除，下次重新查找
+            logger.debug("ADB 无法启动: %s", exc)
+            cls.forget_adb()
         return devices
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _parse_adb_devices(output: str) -> tuple[tuple[str, str], ...]:
+        """解析 adb devices -l 输出；轮询时输出通常不变，直接复用上次结果。"""
+        devices: list[tuple[str, str]] = []
+        for match in ADB_DEVICE_RE.finditer(output):
+            serial, model = match.groups()
+            model = model.replace("_", " ") if model else "Android设备"
+            devices.append((serial, f"{model} ({serial})"))
+        return tuple(devices)
+
     @classmethod
     def get_drive_devices(cls) -> list[tuple[str, str]]:
-        """获取包含哔哩哔哩缓存的驱动器列表。"""
-        devices: list[tuple[str, str]] = []
-        for letter in "DEFGHIJKLMNOPQRSTUVWXYZ":
-            drive_path = Path(f"{letter}:/")
-            if not drive_path.exists():
-                continue
+        """获取包含哔哩哔哩缓存的驱动器列表（短时缓存）。"""
+        return cls._cached_devices("drive", cls._list_drive_devices)
 
-            android_data = drive_path / "Android" / "data"
-            if not android_data.exists():
-                continue
+    @classmethod
+    def _list_drive_devices(cls) -> list[tuple[str, str]]:
+        """检查各驱动器的哔哩哔哩缓存目录，多个驱动器时并发探测（休眠的移动硬盘唤醒较慢）。"""
+        letters = cls._drive_letters()
+        paths = [f"{letter}:/Android/data" for letter in letters]
+        if len(paths) > 1:
+            workers = min(len(paths), cls.DRIVE_PROBE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                found = list(executor.map(cls._has_bili_download, paths))
+        else:
+            found = [cls._has_bili_download(path) for path in paths]
+        return [
+            (f"{letter}:", f"存储设备 ({letter}:)")
+            for letter, has_download in zip(letters, found)
+            if has_download
+        ]
 
-            for source in BILI_SOURCES.values():
-                bili_path = android_data / source["package"] / "download"
-                if bili_path.exists():
-                    devices.append((f"{letter}:", f"存储设备 ({letter}:)"))
-                    break
-        return devices
+    @staticmethod
+    def _has_bili_download(android_data: str) -> bool:
+        """一次 scandir 列出 Android/data，仅对匹配的客户端包检查 download 目录。"""
+        try:
+            with os.scandir(android_data) as iterator:
+                return any(
+                    entry.name in BILI_PACKAGES
+                    and entry.is_dir(follow_symlinks=False)
+                    and os.path.isdir(os.path.join(entry.path, "download"))
+                    for entry in iterator
+                )
+        except OSError:
+            return False
+
+    @classmethod
+    def _drive_letters(cls) -> str:
+        """返回需要检查的盘符（D 起），按 GetLogicalDrives 位掩码与驱动器类型筛选；非 Windows 没有盘符。"""
+        if sys.platform != "win32":
+            return ""
+        letters = "DEFGHIJKLMNOPQRSTUVWXYZ"
+        kernel32 = ctypes.windll.kernel32
+        mask = kernel32.GetLogicalDrives()
+        # 只保留固定/可移动磁盘，避免访问光驱、断开的网络驱动器时长时间卡顿
+        return "".join(
+            letter for letter in letters
+            if mask & (1 << (ord(letter) - ord("A")))
+            and kernel32.GetDriveTypeW(f"{letter}:\\") in cls.LOCAL_DRIVE_TYPES
+        )
 
     @classmethod
     def get_connected_devices(cls) -> list[tuple[str, str, str]]:
-        """获取所有已连接设备（包括ADB和本地驱动器）。"""
+        """获取所有已连接设备（包括ADB和本地驱动器）。
+
+        两类都需要重新枚举时，驱动器枚举在后台线程中与 adb devices 同时进行，
+        总耗时取两者中较长者；自动刷新时通常至少一类命中缓存，直接在当前线程获取。
+        """
+        if cls._is_cache_fresh("adb") or cls._is_cache_fresh("drive"):
+            adb_devices = cls.get_adb_devices()
+            drive_devices = cls.get_drive_devices()
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                drive_future = executor.submit(cls.get_drive_devices)
+                adb_devices = cls.get_adb_devices()
+                drive_devices = drive_future.result()
+
         devices: list[tuple[str, str, str]] = []
-        devices.extend((dev_id, dev_name, "adb") for dev_id, dev_name in cls.get_adb_devices())
-        devices.extend((dev_id, dev_name, "drive") for dev_id, dev_name in cls.get_drive_devices())
+        devices.extend((dev_id, dev_name, "adb") for dev_id, dev_name in adb_devices)
+        devices.extend((dev_id, dev_name, "drive") for dev_id, dev_name in drive_devices)
         return devices
 
     @classmethod
-    def pull_and_convert(
-            cls, video: CachedVideo, output_path: Path, device_id: str, device_type: str
-    ) -> bool:
-        """拉取视频文件并转换为MP4。"""
+    def fetch_source(
+            cls,
+            video: CachedVideo,
+            device_id: str,
+            device_type: str,
+            *,
+            is_cancelled: Callable[[], bool] | None = None,
+            on_process: Callable[[subprocess.Popen[bytes], bool], None] | None = None,
+            scratch_dir: Path | None = None,
+    ) -> tuple[str, Path | None] | None:
+        """准备合并所需的源文件。
+
+        返回 (传给 biliffm4s 的源路径, 用完后需删除的临时目录)；本地模式直接使用
+        combine_path，ADB 模式拉取到临时目录。失败或取消时返回 None。
+        is_cancelled 用于在各步骤之间检查取消；on_process 在每个 adb pull 启动/结束时
+        回调 (子进程, 是否运行中)，供调用方在取消时终止。
+        指定 scratch_dir 时拉取到该目录（由调用方复用和清理），不再创建临时目录。
+        """
         if device_type == "drive" or device_type == "custom_path":
-            return biliffm4s.combine(str(video.combine_path), output=str(output_path))
+            return str(video.combine_path), None
 
-        if device_type == "adb":
-            adb = cls.find_adb()
-            if not adb:
-                return False
+        if device_type != "adb":
+            return None
+        adb = cls.find_adb()
+        if not adb:
+            return None
 
-            temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = scratch_dir or Path(tempfile.mkdtemp())
 
-            # 确保远程路径是字符串（不是 Path 对象）
-            remote_video = str(video.video_path) if isinstance(video.video_path, Path) else video.video_path
-            remote_audio = str(video.audio_path) if isinstance(video.audio_path, Path) else video.audio_path
+        # 确保远程路径是字符串（不是 Path 对象）
+        remote_video = str(video.video_path) if isinstance(video.video_path, Path) else video.video_path
+        remote_audio = str(video.audio_path) if isinstance(video.audio_path, Path) else video.audio_path
 
-            try:
-                local_video = temp_dir / "video.m4s"
-                local_audio = temp_dir / "audio.m4s"
+        fetched = False
+        try:
+            if is_cancelled and is_cancelled():
+                return None
+            # 视频与音频同时拉取；失败的文件（部分设备不支持并发传输）再单独重试
+            pairs = [(remote_video, temp_dir / "video.m4s"), (remote_audio, temp_dir / "audio.m4s")]
+            for pair in cls._pull_files(adb, device_id, pairs, on_process):
+                if is_cancelled and is_cancelled():
+                    return None
+                logger.debug("并行拉取失败，单独重试: %s", pair[0])
+                if cls._pull_files(adb, device_id, [pair], on_process):
+                    # 拉取失败可能是设备已断开，下次查询时重新枚举 ADB 设备
+                    cls.refresh("adb")
+                    return None
+            fetched = True
+            return str(temp_dir), None if scratch_dir else temp_dir
+        finally:
+            if not fetched:
+                if scratch_dir:
+                    cls.clear_scratch(scratch_dir)
+                else:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
 
-                result = run_command(
-                    [adb, "-s", device_id, "pull", remote_video, str(local_video)],
-                    timeout=300,
-                )
-                if result.returncode != 0:
-                    return False
+    @staticmethod
+    def clear_scratch(scratch_dir: Path) -> None:
+        """删除暂存目录中拉取的 m4s 文件（保留目录以便复用）。"""
+        remove_file(scratch_dir / "video.m4s")
+        remove_file(scratch_dir / "audio.m4s")
 
-                result = run_command(
-                    [adb, "-s", device_id, "pull", remote_audio, str(local_audio)],
-                    timeout=300,
-                )
-                if result.returncode != 0:
-                    return False
+    @staticmethod
+    def combine_atomic(
+            source: str,
+            output_path: Path,
+            on_process: Callable[[subprocess.Popen[bytes], bool], None] | None = None,
+    ) -> bool:
+        """合并到同目录的临时文件，成功后原子替换为目标文件，失败不留残缺文件。
 
-                return biliffm4s.combine(str(temp_dir), output=str(output_path))
+        biliffm4s.combine 在独立子进程中执行（以退出码返回结果）：无需依赖其线程安全，
+        取消时也能终止正在进行的合并。on_process 在子进程启动/结束时回调 (子进程, 是否运行中)。
+        """
+        # 保留 .mp4 后缀，ffmpeg 依据扩展名选择封装格式
+        part_path = output_path.with_name(f"{output_path.stem}.part.mp4")
+        remove_file(part_path)
+        try:
+            process = start_process(combine_command(source, str(part_path)))
+            if on_process:
+                on_process(process, True)
+            try:
+                returncode = process.wait()
             finally:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-        return False
+                if on_process:
+                    on_process(process, False)
+            if returncode == 0 and part_path.exists():
+                os.replace(part_path, output_path)
+                return True
+            return False
+        finally:
+            remove_file(part_path)
+
+    @staticmethod
+    def _pull_files(
+            adb: str,
+            device_id: str,
+            pairs: list[tuple[str, Path]],
+            on_process: Callable[[subprocess.Popen[bytes], bool], None] | None,
+    ) -> list[tuple[str, Path]]:
+        """同时启动多个 adb pull 并等待全部结束，返回失败的 (远程, 本地) 列表。
+
+        每个进程最多等待 300 秒，进程可被外部终止。
+        """
+        processes: list[subprocess.Popen[bytes]] = []
+        failed: list[tuple[str, Path]] = []
+        try:
+            for remote, local in pairs:
+                process = start_process([adb, "-s", device_id, "pull", remote, str(local)])
+                processes.append(process)
+                if on_process:
+                    on_process(process, True)
+
+            deadline = time.monotonic() + 300
+            for pair, process in zip(pairs, processes):
+                try:
+                    if process.wait(timeout=max(deadline - time.monotonic(), 0)) != 0:
+                        failed.append(pair)
+                except subprocess.TimeoutExpired:
+                    terminate_process(process)
+                    process.wait()
+                    failed.append(pair)
+        finally:
+            for process in processes:
+                terminate_process(process)
+                if on_process:
+                    on_process(process, False)
+        return failed
+
+
+class AdbDeviceTracker(QObject):
+    """通过 adb server 的 host:track-devices 接收设备连接/断开通知，代替轮询 adb devices。
+
+    连接失败或 adb server 退出时线程结束，设备检测回退为按 DEVICE_CACHE_TTL 轮询。
+    """
+
+    REQUEST = b"host:track-devices"
+    CONNECT_TIMEOUT = 2.0
+
+    changed = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self) -> None:
+        """初始化跟踪器。"""
+        super().__init__()
+        self._socket: socket.socket | None = None
+        self._stopped = False
+
+    @staticmethod
+    def _server_address() -> tuple[str, int]:
+        """返回 adb server 地址（支持 ANDROID_ADB_SERVER_PORT 环境变量）。"""
+        try:
+            port = int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037"))
+        except ValueError:
+            port = 5037
+        return "127.0.0.1", port
+
+    def run(self) -> None:
+        """连接 adb server 并持续读取设备列表变化，结束时发送 finished。"""
+        try:
+            self._track()
+        finally:
+            self.finished.emit()
+
+    def _track(self) -> None:
+        """读取设备变化直到连接断开或被停止。"""
+        try:
+            sock = socket.create_connection(self._server_address(), timeout=self.CONNECT_TIMEOUT)
+        except OSError as exc:
+            logger.debug("无法连接 adb server，设备检测使用轮询: %s", exc)
+            return
+
+        self._socket = sock
+        try:
+            sock.settimeout(None)
+            sock.sendall(b"%04x%s" % (len(self.REQUEST), self.REQUEST))
+            if self._recv_exact(sock, 4) != b"OKAY":
+                return
+            DeviceScanner.set_adb_tracked(True)
+            # 每条消息为 4 位十六进制长度 + 当前设备列表；连接后立即收到第一条
+            while not self._stopped:
+                self._recv_exact(sock, int(self._recv_exact(sock, 4), 16))
+                DeviceScanner.refresh("adb")
+                self.changed.emit()
+        except (OSError, ValueError) as exc:
+            if not self._stopped:
+                logger.debug("adb 设备跟踪中断: %s", exc)
+        finally:
+            DeviceScanner.set_adb_tracked(False)
+            sock.close()
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        """读取指定字节数，连接关闭时抛出 ConnectionError。"""
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("adb server 关闭了连接")
+            data += chunk
+        return data
+
+    def stop(self) -> None:
+        """停止跟踪（关闭连接以唤醒阻塞的读取）。"""
+        self._stopped = True
+        if self._socket:
+            with contextlib.suppress(OSError):
+                self._socket.shutdown(socket.SHUT_RDWR)
 
 
 # ============================================================
@@ -1194,6 +2135,15 @@ class DeviceScanner:
 class ConvertWorker(QObject):
     """视频转换工作线程。"""
 
+    PROGRESS_INTERVAL = 0.1
+    # 本地合并的并发数：每个 ffmpeg 进程基本只占用一个核心
+    MAX_PARALLEL_COMBINES = min(os.cpu_count() or 1, 4)
+    # ADB 暂存目录数：正在合并的视频 + 预先拉取的下一个视频
+    SCRATCH_SLOTS = 2
+    SANITIZE_TABLE = str.maketrans(
+        {**{char: "_" for char in '<>:"/\\|?*'}, **{code: None for code in range(32)}}
+    )
+
     progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(int, int)
     error = pyqtSignal(str)
@@ -1211,58 +2161,230 @@ class ConvertWorker(QObject):
         self.output_dir = output_dir
         self.device_id = device_id
         self.device_type = device_type
+        # 输出路径只计算一次，跳过检查与预取查找都直接按索引取用
+        self.output_paths = [
+            output_dir / f"{self._sanitize_filename(video.display_title)}.mp4" for video in videos
+        ]
         self._cancelled = False
+        self._processes: set[subprocess.Popen[bytes]] = set()
+        self._last_progress = 0.0
+        self._free_slots: list[Path] = []
+        self._fetch_slots: dict[Future[tuple[str, Path | None] | None], Path] = {}
 
     def cancel(self) -> None:
-        """取消转换。"""
+        """取消转换，并立即终止正在进行的拉取与合并进程。"""
         self._cancelled = True
+        for process in list(self._processes):
+            terminate_process(process)
+
+    def _is_cancelled(self) -> bool:
+        """返回是否已取消。"""
+        return self._cancelled
+
+    def _track_process(self, process: subprocess.Popen[bytes], running: bool) -> None:
+        """登记/注销正在运行的子进程；若已取消则立即终止新进程。"""
+        if not running:
+            self._processes.discard(process)
+            return
+        self._processes.add(process)
+        if self._cancelled:
+            terminate_process(process)
+
+    def _emit_progress(self, current: int, total: int, message: str, *, force: bool = False) -> None:
+        """发送进度，距上次发送不足 PROGRESS_INTERVAL 秒时丢弃（force 除外）。"""
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self.progress.emit(current, total, message)
+            self._last_progress = now
 
     def run(self) -> None:
-        """执行转换任务。"""
+        """执行转换任务（ADB 设备逐个传输，本地文件并行合并）。"""
+        if self.device_type == "adb":
+            # 整批视频复用固定的暂存目录，避免每个视频创建/删除一次临时目录
+            scratch_root = Path(tempfile.mkdtemp(prefix="biliandout_"))
+            self._free_slots = [scratch_root / str(slot) for slot in range(self.SCRATCH_SLOTS)]
+            for slot_dir in self._free_slots:
+                slot_dir.mkdir()
+            try:
+                success_count = self._run_pipelined()
+            finally:
+                shutil.rmtree(scratch_root, ignore_errors=True)
+        else:
+            success_count = self._run_parallel()
+        self.finished.emit(success_count, len(self.videos))
+
+    def _run_pipelined(self) -> int:
+        """逐个转换 ADB 设备上的视频，返回成功数量。
+
+        拉取在单独的线程中进行：合并当前视频的同时预先拉取下一个待转换的视频，
+        ADB 传输与 ffmpeg 合并互相重叠，临时文件最多同时存在两份。
+        """
         success_count = 0
         total = len(self.videos)
+        fetches: dict[int, Future[tuple[str, Path | None] | None]] = {}
 
-        for index, video in enumerate(self.videos):
-            if self._cancelled:
-                break
+        with ThreadPoolExecutor(max_workers=1) as fetcher:
+            for index, video in enumerate(self.videos):
+                if self._cancelled:
+                    break
 
-            title_short = (
-                f"{video.display_title[:25]}..."
-                if len(video.display_title) > 25
-                else video.display_title
-            )
-            self.progress.emit(index + 1, total, f"正在转换: {title_short}")
+                title_short = self._short_title(video)
+                output_path = self.output_paths[index]
+                fetch = fetches.pop(index, None)
+
+                # 跳过已存在的文件（用户选择不删除），连续跳过时节流进度
+                if output_path.exists():
+                    if fetch:
+                        self._discard_fetch(fetch)
+                    self._emit_progress(index + 1, total, f"跳过（已存在）: {title_short}")
+                    continue
+
+                # 真正开始转换前总是发送，保证界面显示的是当前视频
+                self._emit_progress(index + 1, total, f"正在转换: {title_short}", force=True)
+
+                if fetch is None:
+                    fetch = self._submit_fetch(fetcher, video)
+                next_index = self._next_pending(index + 1)
+                if next_index is not None:
+                    fetches[next_index] = self._submit_fetch(fetcher, self.videos[next_index])
+
+                try:
+                    if self._convert(fetch, output_path):
+                        success_count += 1
+                    elif not self._cancelled:
+                        self.error.emit(f"转换失败: {title_short}")
+                except Exception as exc:
+                    logger.exception("转换失败")
+                    self.error.emit(f"错误: {str(exc)[:50]}")
+
+            for fetch in fetches.values():
+                fetch.cancel()
+
+        # 线程池已退出，清理取消或中断后未使用的拉取结果
+        for fetch in fetches.values():
+            self._discard_fetch(fetch)
+        return success_count
+
+    def _run_parallel(self) -> int:
+        """并行合并本地视频（无需拉取，USB 不是瓶颈），返回成功数量。
+
+        每个合并在独立子进程中执行，取消时正在进行的合并也会被终止。
+        """
+        success_count = 0
+        done = 0
+        total = len(self.videos)
+        submitted: set[Path] = set()
+
+        with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_COMBINES) as pool:
+            futures: dict[Future[bool], str] = {}
+            for video, output_path in zip(self.videos, self.output_paths):
+                title_short = self._short_title(video)
+                # 同名视频只合并一次，与逐个转换时“后者已存在而跳过”一致
+                if output_path in submitted or output_path.exists():
+                    done += 1
+                    self._emit_progress(done, total, f"跳过（已存在）: {title_short}")
+                    continue
+                submitted.add(output_path)
+                futures[pool.submit(self._combine_local, video, output_path)] = title_short
+
+            for future in as_completed(futures):
+                title_short = futures[future]
+                done += 1
+                try:
+                    if future.result():
+                        success_count += 1
+                        self._emit_progress(done, total, f"已转换: {title_short}", force=True)
+                    elif not self._cancelled:
+                        self.error.emit(f"转换失败: {title_short}")
+                except Exception as exc:
+                    logger.exception("转换失败")
+                    self.error.emit(f"错误: {str(exc)[:50]}")
+                if self._cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
-            safe_title = self._sanitize_filename(video.display_title)
-            output_path = self.output_dir / f"{safe_title}.mp4"
+        return success_count
 
-            # 跳过已存在的文件（用户选择不删除）
-            if output_path.exists():
-                self.error.emit(f"跳过（已存在）: {title_short}")
-                continue
+    def _combine_local(self, video: CachedVideo, output_path: Path) -> bool:
+        """合并本地视频（在线程池中执行）。"""
+        if self._cancelled:
+            return False
+        return DeviceScanner.combine_atomic(str(video.combine_path), output_path, self._track_process)
+
+    @staticmethod
+    def _short_title(video: CachedVideo) -> str:
+        """返回用于状态栏显示的截断标题。"""
+        title = video.display_title
+        return f"{title[:25]}..." if len(title) > 25 else title
+
+    def _next_pending(self, start: int) -> int | None:
+        """返回从 start 开始第一个输出文件尚不存在的视频索引。"""
+        for index in range(start, len(self.output_paths)):
+            if not self.output_paths[index].exists():
+                return index
+        return None
 
+    def _submit_fetch(
+            self, fetcher: ThreadPoolExecutor, video: CachedVideo
+    ) -> Future[tuple[str, Path | None] | None]:
+        """提交拉取任务（有空闲暂存目录时拉取到该目录）。"""
+        slot_dir = self._free_slots.pop() if self._free_slots else None
+        fetch = fetcher.submit(
+            DeviceScanner.fetch_source,
+            video,
+            self.device_id,
+            self.device_type,
+            is_cancelled=self._is_cancelled,
+            on_process=self._track_process,
+            scratch_dir=slot_dir,
+        )
+        if slot_dir:
+            self._fetch_slots[fetch] = slot_dir
+        return fetch
+
+    def _release_slot(self, fetch: Future[tuple[str, Path | None] | None]) -> None:
+        """清空拉取任务占用的暂存目录并放回空闲列表。"""
+        slot_dir = self._fetch_slots.pop(fetch, None)
+        if slot_dir:
+            DeviceScanner.clear_scratch(slot_dir)
+            self._free_slots.append(slot_dir)
+
+    def _convert(self, fetch: Future[tuple[str, Path | None] | None], output_path: Path) -> bool:
+        """等待拉取完成后合并，并清理临时文件。"""
+        try:
+            source = fetch.result()
+            if source is None:
+                return False
+            source_path, temp_dir = source
             try:
-                result = DeviceScanner.pull_and_convert(
-                    video, output_path, self.device_id, self.device_type
-                )
-                if result:
-                    success_count += 1
-                else:
-                    self.error.emit(f"转换失败: {title_short}")
-            except Exception as exc:
-                logger.exception("转换失败")
-                self.error.emit(f"错误: {str(exc)[:50]}")
+                if self._cancelled:
+                    return False
+                return DeviceScanner.combine_atomic(source_path, output_path, self._track_process)
+            finally:
+                if temp_dir:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+        finally:
+            self._release_slot(fetch)
 
-        self.finished.emit(success_count, total)
+    def _discard_fetch(self, fetch: Future[tuple[str, Path | None] | None]) -> None:
+        """丢弃不再需要的拉取结果（等待其结束后清理临时文件）。"""
+        try:
+            if fetch.cancel():
+                return
+            source = fetch.result()
+        except Exception as exc:
+            logger.debug("预先拉取失败: %s", exc)
+            return
+        finally:
+            self._release_slot(fetch)
+        if source and source[1]:
+            shutil.rmtree(source[1], ignore_errors=True)
 
-    @staticmethod
-    def _sanitize_filename(filename: str) -> str:
-        """清理文件名中的非法字符。"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-        filename = "".join(char for char in filename if ord(char) >= 32)
-        return filename[:180].strip()
+    @classmethod
+    def _sanitize_filename(cls, filename: str) -> str:
+        """清理文件名中的非法字符（非法字符替换为下划线，控制字符删除）。"""
+        return filename.translate(cls.SANITIZE_TABLE)[:180].strip()
 
 
 # ============================================================
@@ -1288,17 +2410,9 @@ class AboutDialog(QDialog):
         if icon_path and icon_path.exists():
             logo = QLabel()
             logo.setFixedSize(56, 56)
-            pixmap = QPixmap(str(icon_path))
-            if not pixmap.isNull():
-                device_ratio = self.devicePixelRatioF()
-                target_size = QSize(56, 56) * device_ratio
-                scaled = pixmap.scaled(
-                    target_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                scaled.setDevicePixelRatio(device_ratio)
-                logo.setPixmap(scaled)
+            pixmap = load_scaled_logo(str(icon_path), 56, self.devicePixelRatioF())
+            if pixmap is not None:
+                logo.setPixmap(pixmap)
             header.addWidget(logo)
 
         title_box = QVBoxLayout()
@@ -1309,7 +2423,7 @@ class AboutDialog(QDialog):
         title_box.addWidget(title)
 
         version = QLabel(f"版本 {VERSION}")
-        version.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 10px;")
+        version.setObjectName("aboutVersionLabel")
         title_box.addWidget(version)
 
         header.addLayout(title_box)
@@ -1318,7 +2432,7 @@ class AboutDialog(QDialog):
 
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet(f"background-color: {COLORS['border']};")
+        sep.setObjectName("aboutSeparator")
         sep.setFixedHeight(1)
         layout.addWidget(sep)
 
@@ -1357,34 +2471,27 @@ class AboutDialog(QDialog):
 # 页面栈管理
 # ============================================================
 class WidgetStack:
-    """简单的Widget栈管理器。"""
+    """按名称切换页面的 QStackedWidget 封装。"""
 
     def __init__(self) -> None:
         """初始化栈管理器。"""
-        self.container = QWidget()
-        self.layout = QVBoxLayout(self.container)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        self.layout.setSpacing(0)
+        self.container = QStackedWidget()
         self.pages: dict[str, QWidget] = {}
         self.current_key: str | None = None
 
     def add_page(self, key: str, widget: QWidget) -> None:
-        """添加页面。"""
+        """添加页面（第一个添加的页面为当前页）。"""
         self.pages[key] = widget
-        widget.setVisible(False)
-        self.layout.addWidget(widget)
+        self.container.addWidget(widget)
         if self.current_key is None:
-            self.show_page(key)
+            self.current_key = key
 
     def show_page(self, key: str) -> None:
         """显示指定页面。"""
-        if key == self.current_key:
+        if key == self.current_key or key not in self.pages:
             return
-        if self.current_key and self.current_key in self.pages:
-            self.pages[self.current_key].setVisible(False)
-        if key in self.pages:
-            self.pages[key].setVisible(True)
-            self.current_key = key
+        self.container.setCurrentWidget(self.pages[key])
+        self.current_key = key
 
 
 # ============================================================
@@ -1393,20 +2500,47 @@ class WidgetStack:
 class MainWindow(QMainWindow):
     """应用程序主窗口。"""
 
+    # 扫描结果合并刷新到列表的间隔（毫秒）
+    FOUND_FLUSH_INTERVAL_MS = 50
+    # 拖动改变窗口大小时，停止变化该时长（毫秒）后才重新计算输出路径显示
+    RESIZE_DEBOUNCE_MS = 40
+
     def __init__(self) -> None:
         """初始化主窗口。"""
         super().__init__()
-        self.videos: list[CachedVideo] = []
+        self.video_model = VideoListModel(self)
         self.convert_thread: QThread | None = None
         self.convert_worker: ConvertWorker | None = None
         self.scan_thread: QThread | None = None
         self.scan_worker: ScanWorker | None = None
+        self.tracker_thread: QThread | None = None
+        self.tracker: AdbDeviceTracker | None = None
         self.scan_state = ScanState.IDLE
         self._custom_path: Path | None = None  # 存储自定义路径
+        self._selected_rows: set[int] = set()  # 选中行号，随选择增量维护
+        self._about_dialog: AboutDialog | None = None
+        self._pending_videos: list[CachedVideo] = []  # 等待加入列表的扫描结果
+        self._pending_ui = UiUpdate.NONE
 
         self.auto_refresh_timer = QTimer(self)
         self.auto_refresh_timer.timeout.connect(self._auto_refresh_devices)
 
+        self.found_flush_timer = QTimer(self)
+        self.found_flush_timer.setSingleShot(True)
+        self.found_flush_timer.setInterval(self.FOUND_FLUSH_INTERVAL_MS)
+        self.found_flush_timer.timeout.connect(self._flush_pending_videos)
+
+        self.ui_update_timer = QTimer(self)
+        self.ui_update_timer.setSingleShot(True)
+        self.ui_update_timer.setInterval(0)
+        self.ui_update_timer.timeout.connect(self._flush_ui_updates)
+
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self.resize_timer.timeout.connect(self._update_output_label)
+        self._output_label_key: tuple[str, int] | None = None
+
         base_path = (
             Path(sys.executable).parent
             if getattr(sys, "frozen", False)
@@ -1425,6 +2559,12 @@ class MainWindow(QMainWindow):
         self._connect_signals()
         self._refresh_devices()
         self._start_auto_refresh_if_needed()
+        self._start_device_tracker()
+
+    @property
+    def videos(self) -> list[CachedVideo]:
+        """返回列表中的全部视频（由列表模型持有）。"""
+        return self.video_model.videos
 
     @property
     def selected_device(self) -> tuple[str, str] | None:
@@ -1438,12 +2578,12 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(420, 480)
         self.resize(480, 560)
 
-        if self.icon_path.exists():
-            pixmap = QPixmap(str(self.icon_path))
-            if not pixmap.isNull():
-                self.setWindowIcon(QIcon(pixmap))
-
-        self.setStyleSheet(STYLESHEET)
+        # 图标与样式表都挂在 QApplication 上，主窗口和对话框共用同一份
+        # （QIcon 按路径构造，实际需要绘制时才解码）
+        app = QApplication.instance()
+        if self.icon_path.exists() and app.windowIcon().isNull():
+            app.setWindowIcon(QIcon(str(self.icon_path)))
+        app.setStyleSheet(STYLESHEET)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -1557,11 +2697,16 @@ class MainWindow(QMainWindow):
         self.video_stack.add_page("loading", self.loading_widget)
 
         # 视频列表页
-        self.video_list = QListWidget()
-        self.video_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        self.video_list = QListView()
+        self.video_list.setObjectName("videoList")
+        self.video_list.setModel(self.video_model)
+        self.video_delegate = VideoItemDelegate(self.video_list)
+        self.video_list.setItemDelegate(self.video_delegate)
+        self.video_list.setUniformItemSizes(True)
+        self.video_list.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.video_list.setSpacing(4)
         self.video_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.video_list.setVerticalScrollMode(QListWidget.ScrollMode.ScrollPerPixel)
+        self.video_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.video_stack.add_page("list", self.video_list)
 
         main_layout.addWidget(video_group, 1)
@@ -1646,40 +2791,25 @@ class MainWindow(QMainWindow):
         self._refresh_video_view()
 
     def _update_output_label(self) -> None:
-        """更新输出目录标签显示。"""
+        """更新输出目录标签显示（路径与可用宽度都未变化时跳过）。"""
         display = str(self.output_dir)
         metrics = self.output_label.fontMetrics()
         available_width = max(120, self.output_label.width() - 8)
+        if self._output_label_key == (display, available_width):
+            return
+        self._output_label_key = (display, available_width)
         elided = metrics.elidedText(display, Qt.TextElideMode.ElideLeft, available_width)
         self.output_label.setText(elided)
         self.output_label.setToolTip(str(self.output_dir))
 
     def resizeEvent(self, event) -> None:
-        """处理窗口大小变化。"""
+        """处理窗口大小变化（输出路径显示合并到拖动停止后更新一次）。"""
         super().resizeEvent(event)
-        self._update_output_label()
-        self._update_list_item_sizes()
-
-    def _update_list_item_sizes(self) -> None:
-        """更新列表项大小以适应窗口宽度。"""
-        if not self.video_list.isVisible():
-            return
-
-        list_width = self.video_list.viewport().width()
-        if list_width <= 0:
-            return
-
-        for index in range(self.video_list.count()):
-            item = self.video_list.item(index)
-            widget = self.video_list.itemWidget(item)
-            if widget:
-                widget.setFixedWidth(list_width)  # 去掉 -10
-                hint = widget.sizeHint()
-                item.setSizeHint(QSize(list_width, max(hint.height(), 90)))
+        self.resize_timer.start()
 
     def _connect_signals(self) -> None:
         """连接信号与槽。"""
-        self.refresh_btn.clicked.connect(self._refresh_devices)
+        self.refresh_btn.clicked.connect(self._on_refresh_clicked)
         self.scan_btn.clicked.connect(self._scan_videos)
         self.browse_btn.clicked.connect(self._browse_output)
         self.export_btn.clicked.connect(self._start_export)
@@ -1691,8 +2821,9 @@ class MainWindow(QMainWindow):
         self.source_combo.currentIndexChanged.connect(self._on_source_changed)
         self.scan_pause_btn.clicked.connect(self._toggle_scan_pause)
         self.scan_cancel_btn.clicked.connect(self._cancel_scan)
-        self.video_list.itemSelectionChanged.connect(self._on_selection_changed)
+        self.video_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
+    @pyqtSlot(int)
     def _on_source_changed(self, _: int) -> None:
         """处理来源切换。"""
         source_key = self.source_combo.currentData()
@@ -1723,10 +2854,16 @@ class MainWindow(QMainWindow):
                 self.source_combo.setCurrentIndex(0)
                 self.source_combo.blockSignals(False)
 
-    def _on_selection_changed(self) -> None:
-        """处理选择变化。"""
-        self._sync_item_selection_styles()
-        self._update_action_states()
+    @pyqtSlot(QItemSelection, QItemSelection)
+    def _on_selection_changed(self, selected: QItemSelection, deselected: QItemSelection) -> None:
+        """处理选择变化，按选择区间更新选中行（不为每行创建索引对象，选中样式由委托绘制）。"""
+        for selection_range in deselected:
+            self._selected_rows.difference_update(
+                range(selection_range.top(), selection_range.bottom() + 1)
+            )
+        for selection_range in selected:
+            self._selected_rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        self._schedule_ui_update(UiUpdate.ACTIONS)
 
     def _start_auto_refresh_if_needed(self) -> None:
         """未连接设备时启动自动刷新。"""
@@ -1735,6 +2872,7 @@ class MainWindow(QMainWindow):
         else:
             self.auto_refresh_timer.stop()
 
+    @pyqtSlot()
     def _auto_refresh_devices(self) -> None:
         """自动刷新设备（静默方式）。"""
         if self.scan_state != ScanState.IDLE:
@@ -1750,39 +2888,75 @@ class MainWindow(QMainWindow):
         elif not devices and current_data:
             self._refresh_devices()
 
+    @pyqtSlot()
+    def _on_refresh_clicked(self) -> None:
+        """手动刷新：丢弃设备缓存后重新枚举（设备跟踪已断开时重新连接）。"""
+        DeviceScanner.refresh()
+        self._refresh_devices()
+        self._start_device_tracker()
+
+    def _start_device_tracker(self) -> None:
+        """在后台线程中跟踪 ADB 设备变化（已在运行时不重复启动）。"""
+        if self.tracker_thread and self.tracker_thread.isRunning():
+            return
+        self._stop_device_tracker()
+        self.tracker_thread = QThread()
+        self.tracker = AdbDeviceTracker()
+        self.tracker.moveToThread(self.tracker_thread)
+        self.tracker_thread.started.connect(self.tracker.run)
+        self.tracker.changed.connect(self._auto_refresh_devices)
+        self.tracker.finished.connect(self.tracker_thread.quit)
+        self.tracker_thread.start()
+
+    def _stop_device_tracker(self) -> None:
+        """停止设备跟踪线程。"""
+        if self.tracker:
+            self.tracker.stop()
+        if self.tracker_thread:
+            self.tracker_thread.quit()
+            self.tracker_thread.wait()
+            self.tracker_thread = None
+            self.tracker = None
+
+    @pyqtSlot()
     def _refresh_devices(self) -> None:
-        """刷新设备列表。"""
-        self.device_combo.clear()
-        self.videos.clear()
-        self.video_list.clear()
-        self._update_counts()
+        """刷新设备列表。
+
+        重建下拉框期间屏蔽其信号，清空列表、刷新视图和自动检测只在此处各执行一次，
+        不会因 clear/addItem 触发的 currentIndexChanged 重复执行 _on_device_changed。
+        """
         devices = DeviceScanner.get_connected_devices()
 
+        self.device_combo.blockSignals(True)
+        self.device_combo.clear()
         if not devices:
             self.device_combo.addItem("未检测到设备", None)
-            self.status_bar.showMessage("未检测到设备，正在自动检测...")
-            self._start_auto_refresh_if_needed()
         else:
             for dev_id, dev_name, dev_type in devices:
                 self.device_combo.addItem(dev_name, (dev_id, dev_type))
+        self.device_combo.blockSignals(False)
+
+        self._clear_videos()
+        if not devices:
+            self.status_bar.showMessage("未检测到设备，正在自动检测...")
+            self._start_auto_refresh_if_needed()
+        else:
             self.status_bar.showMessage(f"检测到 {len(devices)} 个设备")
             self.auto_refresh_timer.stop()
         self._refresh_video_view()
-        self._update_action_states()
 
+    @pyqtSlot(int)
     def _on_device_changed(self, _: int) -> None:
         """处理设备切换。"""
-        self.videos.clear()
-        self.video_list.clear()
-        self._update_counts()
+        self._clear_videos()
         self._refresh_video_view()
-        self._update_action_states()
         self._start_auto_refresh_if_needed()
         if not self.selected_device:
             self.status_bar.showMessage("未连接设备，正在自动检测...")
         else:
             self.status_bar.showMessage("设备就绪")
 
+    @pyqtSlot()
     def _scan_videos(self) -> None:
         """开始扫描视频。"""
         if self.scan_state != ScanState.IDLE:
@@ -1804,18 +2978,16 @@ class MainWindow(QMainWindow):
             device_id, device_type = selected_device
             source_key = source_data
 
-        self.videos.clear()
-        self.video_list.clear()
-        self._update_counts()
-        self._clear_cover_cache()
+        self._clear_videos()
+        cover_dir = self._clear_cover_cache()
 
         self.scan_thread = QThread()
-        self.scan_worker = ScanWorker(device_id, device_type, source_key, COVER_CACHE_DIR)
+        self.scan_worker = ScanWorker(device_id, device_type, source_key, cover_dir)
         self.scan_worker.moveToThread(self.scan_thread)
 
         self.scan_thread.started.connect(self.scan_worker.run)
         self.scan_worker.progress.connect(self._on_scan_progress)
-        self.scan_worker.found.connect(self._on_video_found)
+        self.scan_worker.found.connect(self._on_videos_found)
         self.scan_worker.finished.connect(self._on_scan_finished)
         self.scan_worker.error.connect(self._on_scan_error)
 
@@ -1826,6 +2998,7 @@ class MainWindow(QMainWindow):
         self._set_scan_state(ScanState.LOADING)
         self.status_bar.showMessage("正在加载缓存视频...")
 
+    @pyqtSlot()
     def _toggle_scan_pause(self) -> None:
         """切换扫描暂停状态。"""
         if not self.scan_worker:
@@ -1841,12 +3014,14 @@ class MainWindow(QMainWindow):
             self._set_scan_state(ScanState.PAUSED)
             self.status_bar.showMessage("已暂停 - 选择视频后可导出")
 
+    @pyqtSlot()
     def _cancel_scan(self) -> None:
         """取消扫描。"""
         if self.scan_worker:
             self.scan_worker.cancel()
             self.status_bar.showMessage("正在取消...")
 
+    @pyqtSlot(int, int)
     def _on_scan_progress(self, current: int, total: int) -> None:
         """处理扫描进度。"""
         if total <= 0:
@@ -1858,12 +3033,24 @@ class MainWindow(QMainWindow):
             self.loading_status_label.setText(f"扫描 {current}/{total}")
         self.status_bar.showMessage(f"扫描 ({current}/{total})")
 
-    def _on_video_found(self, video: CachedVideo) -> None:
-        """处理发现的视频。"""
-        self.videos.append(video)
-        self._add_video_item(video)
-        self._update_counts()
+    @pyqtSlot(list)
+    def _on_videos_found(self, videos: list[CachedVideo]) -> None:
+        """缓冲发现的视频，短时间内到达的多批结果合并为一次列表更新。"""
+        self._pending_videos.extend(videos)
+        if not self.found_flush_timer.isActive():
+            self.found_flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending_videos(self) -> None:
+        """将缓冲的视频加入列表（整批只触发一次布局和重绘）。"""
+        self.found_flush_timer.stop()
+        if not self._pending_videos:
+            return
+        videos, self._pending_videos = self._pending_videos, []
+        self.video_model.append_videos(videos)
+        self._schedule_ui_update(UiUpdate.COUNTS)
 
+    @pyqtSlot(int)
     def _on_scan_finished(self, count: int) -> None:
         """处理扫描完成。"""
         self._cleanup_scan_thread()
@@ -1878,6 +3065,7 @@ class MainWindow(QMainWindow):
             self._set_empty_hint("no_video")
         self._refresh_video_view()
 
+    @pyqtSlot(str)
     def _on_scan_error(self, msg: str) -> None:
         """处理扫描错误。"""
         self.status_bar.showMessage(msg)
@@ -1890,40 +3078,61 @@ class MainWindow(QMainWindow):
             self.scan_thread = None
             self.scan_worker = None
 
-    def _add_video_item(self, video: CachedVideo) -> None:
-        """添加视频到列表。"""
-        item = QListWidgetItem()
-        item.setData(Qt.ItemDataRole.UserRole, video)
-
-        widget = VideoListItemWidget(video)
-
-        list_width = self.video_list.viewport().width()
-        if list_width > 0:
-            widget.setFixedWidth(list_width)  # 去掉 -10
+    def _clear_videos(self) -> None:
+        """清空视频列表及选择状态。"""
+        self.found_flush_timer.stop()
+        self._pending_videos.clear()
+        self.video_model.clear()
+        self._selected_rows.clear()
+        self._schedule_ui_update(UiUpdate.COUNTS)
 
-        item.setSizeHint(QSize(list_width if list_width > 0 else 300, 90))
+    def _clear_cover_cache(self) -> Path:
+        """清除封面缓存，返回本次扫描使用的新封面目录。
 
-        self.video_list.addItem(item)
-        self.video_list.setItemWidget(item, widget)
-
-    def _sync_item_selection_styles(self) -> None:
-        """同步列表项选中样式。"""
-        for index in range(self.video_list.count()):
-            item = self.video_list.item(index)
-            widget = self.video_list.itemWidget(item)
-            if isinstance(widget, VideoListItemWidget):
-                widget.apply_selection(item.isSelected())
+        新扫描写入独立的子目录，旧封面在后台线程中删除，不阻塞界面；
+        待删除项在创建新目录前列出，后台删除不会波及新目录。
+        """
+        COVER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            with os.scandir(COVER_CACHE_DIR) as iterator:
+                stale = [Path(entry.path) for entry in iterator]
+        except OSError:
+            stale = []
+        cover_dir = Path(tempfile.mkdtemp(prefix="scan_", dir=COVER_CACHE_DIR))
+        if stale:
+            threading.Thread(target=self._remove_paths, args=(stale,), daemon=True).start()
+        # 旧封面即将删除，内存中的解码结果随之失效
+        QPixmapCache.clear()
+        self.video_delegate.forget_broken_covers()
+        return cover_dir
 
-    def _clear_cover_cache(self) -> None:
-        """清除封面缓存。"""
-        if not COVER_CACHE_DIR.exists():
-            return
-        for file in COVER_CACHE_DIR.glob("*.jpg"):
-            remove_file(file)
+    @staticmethod
+    def _remove_paths(paths: list[Path]) -> None:
+        """删除给定的文件或目录（在后台线程中执行）。"""
+        for path in paths:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                remove_file(path)
+
+    def _schedule_ui_update(self, parts: UiUpdate) -> None:
+        """标记需要刷新的界面部分，在本轮事件处理结束后统一刷新一次。"""
+        self._pending_ui |= parts
+        if not self.ui_update_timer.isActive():
+            self.ui_update_timer.start()
+
+    @pyqtSlot()
+    def _flush_ui_updates(self) -> None:
+        """执行挂起的界面刷新（期间已同步刷新过的部分不会重复执行）。"""
+        if self._pending_ui & UiUpdate.ACTIONS:
+            self._update_action_states()
+        elif self._pending_ui & UiUpdate.COUNTS:
+            self._update_counts()
 
     def _update_counts(self) -> None:
         """更新视频计数。"""
-        selected_count = len(self._get_selected())
+        self._pending_ui &= ~UiUpdate.COUNTS
+        selected_count = len(self._selected_rows)
         total_count = len(self.videos)
         if selected_count > 0:
             self.count_label.setText(f"已选 {selected_count}/{total_count} 个视频")
@@ -1947,9 +3156,6 @@ class MainWindow(QMainWindow):
                 self.video_stack.show_page("empty")
         self._update_action_states()
 
-        # 延迟更新列表项大小
-        QTimer.singleShot(50, self._update_list_item_sizes)
-
     def _update_empty_hint(self, mode: str = "") -> None:
         """更新空状态提示。"""
         if not self.videos and self.scan_state == ScanState.IDLE:
@@ -1971,7 +3177,8 @@ class MainWindow(QMainWindow):
         self._update_empty_hint(mode)
 
     def _set_scan_state(self, state: ScanState) -> None:
-        """设置扫描状态。"""
+        """设置扫描状态（先将缓冲的扫描结果加入列表，保证页面与计数一致）。"""
+        self._flush_pending_videos()
         self.scan_state = state
         if state == ScanState.LOADING:
             self.scan_btn.setEnabled(False)
@@ -1998,25 +3205,20 @@ class MainWindow(QMainWindow):
         return self.selected_device is not None
 
     def _get_selected(self) -> list[CachedVideo]:
-        """获取选中的视频列表。"""
-        selected: list[CachedVideo] = []
-        for index in range(self.video_list.count()):
-            item = self.video_list.item(index)
-            if item.isSelected():
-                video = item.data(Qt.ItemDataRole.UserRole)
-                if video:
-                    selected.append(video)
-        return selected
+        """获取选中的视频列表（按列表顺序）。"""
+        return [self.videos[row] for row in sorted(self._selected_rows)]
 
+    @pyqtSlot()
     def _select_all(self) -> None:
         """全选视频。"""
-        for index in range(self.video_list.count()):
-            self.video_list.item(index).setSelected(True)
+        self.video_list.selectAll()
 
+    @pyqtSlot()
     def _deselect_all(self) -> None:
         """取消全选。"""
         self.video_list.clearSelection()
 
+    @pyqtSlot()
     def _browse_output(self) -> None:
         """浏览输出目录。"""
         path = QFileDialog.getExistingDirectory(self, "选择输出目录", str(self.output_dir))
@@ -2024,6 +3226,7 @@ class MainWindow(QMainWindow):
             self.output_dir = Path(path)
             self._update_output_label()
 
+    @pyqtSlot()
     def _start_export(self) -> None:
         """开始导出。"""
         selected = self._get_selected()
@@ -2046,13 +3249,15 @@ class MainWindow(QMainWindow):
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # 检查同名文件
+        # 检查同名文件：一次 scandir 列出输出目录，不逐个 stat
+        # （normcase 在 Windows 下忽略大小写，与文件系统一致）
+        existing_names = self._existing_mp4_names()
+        sanitize = ConvertWorker._sanitize_filename
         existing_files: list[Path] = []
         for video in selected:
-            safe_title = ConvertWorker._sanitize_filename(video.display_title)
-            output_path = self.output_dir / f"{safe_title}.mp4"
-            if output_path.exists():
-                existing_files.append(output_path)
+            name = existing_names.get(os.path.normcase(f"{sanitize(video.display_title)}.mp4"))
+            if name is not None:
+                existing_files.append(self.output_dir / name)
 
         if existing_files:
             file_list = "\n".join(f.name for f in existing_files[:5])
@@ -2098,17 +3303,32 @@ class MainWindow(QMainWindow):
 
         self.convert_thread.start()
 
+    def _existing_mp4_names(self) -> dict[str, str]:
+        """返回输出目录中已有的 .mp4 文件名（normcase 后的名称 -> 实际名称）。"""
+        try:
+            with os.scandir(self.output_dir) as iterator:
+                return {
+                    os.path.normcase(entry.name): entry.name
+                    for entry in iterator
+                    if entry.name.lower().endswith(".mp4") and entry.is_file()
+                }
+        except OSError:
+            return {}
+
+    @pyqtSlot()
     def _cancel_export(self) -> None:
         """取消导出。"""
         if self.convert_worker:
             self.convert_worker.cancel()
 
+    @pyqtSlot(int, int, str)
     def _on_convert_progress(self, current: int, total: int, msg: str) -> None:
         """处理转换进度。"""
         self.export_progress_bar.setValue(current)
         self.export_progress_bar.setFormat(f"{current}/{total}")
         self.status_bar.showMessage(msg)
 
+    @pyqtSlot(int, int)
     def _on_convert_finished(self, success: int, total: int) -> None:
         """处理转换完成。"""
         self._cleanup_convert_thread()
@@ -2121,6 +3341,7 @@ class MainWindow(QMainWindow):
         )
         self.status_bar.showMessage(f"导出完成: {success}/{total}")
 
+    @pyqtSlot(str)
     def _on_convert_error(self, msg: str) -> None:
         """处理转换错误。"""
         self.status_bar.showMessage(msg)
@@ -2151,11 +3372,14 @@ class MainWindow(QMainWindow):
             widget.setEnabled(enabled)
         if not enabled:
             self.export_btn.setEnabled(False)
+            # 导出期间不让延迟的按钮刷新重新启用控件
+            self._pending_ui &= ~UiUpdate.ACTIONS
         else:
             self._update_action_states()
 
     def _update_action_states(self) -> None:
         """更新操作按钮状态。"""
+        self._pending_ui &= ~UiUpdate.ACTIONS
         is_loading = self.scan_state == ScanState.LOADING
         is_paused = self.scan_state == ScanState.PAUSED
         is_idle = self.scan_state == ScanState.IDLE
@@ -2168,7 +3392,7 @@ class MainWindow(QMainWindow):
         self.about_btn.setEnabled(True)
 
         has_videos = bool(self.videos)
-        has_selection = len(self._get_selected()) > 0
+        has_selection = bool(self._selected_rows)
         
         self.select_all_btn.setEnabled(has_videos and (is_idle or is_paused))
         self.deselect_btn.setEnabled(has_videos and (is_idle or is_paused))
@@ -2183,9 +3407,12 @@ class MainWindow(QMainWindow):
         # 更新计数显示
         self._update_counts()
 
+    @pyqtSlot()
     def _show_about(self) -> None:
-        """显示关于对话框。"""
-        AboutDialog(self, self.icon_path).exec()
+        """显示关于对话框（首次打开时创建，之后复用）。"""
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self, self.icon_path)
+        self._about_dialog.exec()
 
     def closeEvent(self, event) -> None:
         """处理窗口关闭事件。"""
@@ -2211,6 +3438,7 @@ class MainWindow(QMainWindow):
             self._cleanup_scan_thread()
 
         self.auto_refresh_timer.stop()
+        self._stop_device_tracker()
         event.accept()
 
 
@@ -2219,12 +3447,18 @@ class MainWindow(QMainWindow):
 # ============================================================
 def main() -> None:
     """应用程序入口点。"""
+    if len(sys.argv) == 4 and sys.argv[1] == COMBINE_ARG:
+        # 作为合并子进程运行（见 combine_command），不创建界面
+        sys.exit(0 if biliffm4s.combine(sys.argv[2], output=sys.argv[3]) else 1)
+
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
 
     app = QApplication(sys.argv)
+    app.setApplicationName("biliandout")
     app.setStyle("Fusion")
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
 
     palette = QPalette()
     palette.setColor(QPalette.ColorRole.Window, QColor(COLORS["background"]))